@@ -34,8 +34,10 @@ BINARY_FILE_EXTENSIONS = {
 }
 
 # Preview limits / chunking
-PREVIEW_CHUNK_SIZE = 10240                # characters for preview
+PREVIEW_CHUNK_SIZE = 10240                # bytes read for preview
 PREVIEW_MAX_BYTES = 2 * 1024 * 1024       # 2 MB
+PREVIEW_MAX_LINES = 2000                  # lines shown in preview
+PREVIEW_MAX_LINE_CHARS = 4000             # longer lines (minified JSON/JS) are cut
 
 # Processing safeguard: skip huge files (write a note)
 PROCESS_MAX_BYTES = 50 * 1024 * 1024      # 50 MB
@@ -2,7 +2,8 @@
 
 import os
 import fnmatch
-from typing import Generator, Tuple, Literal
+from dataclasses import dataclass
+from typing import Generator, Optional, Tuple, Literal
 from src.utils.logger import logger
 from src.config import PREDEFINED_EXCLUDED_FILES, BINARY_FILE_EXTENSIONS, EXCLUDED_FOLDER_NAMES_DEFAULT
 
@@ -11,6 +12,61 @@ from pathspec import PathSpec
 
 FileType = Literal['text', 'binary']
 
+@dataclass(slots=True)
+class FileRow:
+    """One scanned file as handed to the Files table."""
+    name: str
+    rel: str
+    typ: FileType
+    type_display: str = ""          # friendly label, e.g. "Python"
+    size: Optional[int] = None
+    mtime: Optional[float] = None
+    path_label: str = ""            # "Path" column text ("root" for top level)
+
+# Friendly "Type" column labels, by extension and by bare filename
+_EXT_TYPE_MAP = {
+    ".py": "Python", ".pyw": "Python",
+    ".pyi": "Python Stubs",
+    ".json": "JSON", ".jsonc": "JSONC",
+    ".toml": "TOML",
+    ".yaml": "YAML", ".yml": "YAML",
+    ".md": "Markdown", ".markdown": "Markdown",
+    ".txt": "Text", ".rst": "reStructuredText",
+    ".ini": "INI", ".cfg": "INI", ".conf": "Config",
+    ".csv": "CSV", ".tsv": "TSV", ".log": "Log",
+    ".xml": "XML",
+    ".html": "HTML", ".htm": "HTML",
+    ".css": "CSS",
+    ".js": "JavaScript", ".mjs": "JavaScript",
+    ".ts": "TypeScript", ".jsx": "JSX", ".tsx": "TSX",
+    ".c": "C", ".h": "C Header",
+    ".cc": "C++", ".cpp": "C++", ".cxx": "C++",
+    ".hpp": "C++ Header", ".hh": "C++ Header",
+    ".cs": "C#", ".java": "Java", ".kt": "Kotlin",
+    ".go": "Go", ".rs": "Rust", ".rb": "Ruby",
+    ".php": "PHP", ".swift": "Swift",
+    ".sh": "Shell", ".ps1": "PowerShell", ".bat": "Batch", ".cmd": "Batch",
+}
+_NAME_TYPE_MAP = {
+    "makefile": "Makefile",
+    "dockerfile": "Dockerfile",
+    ".gitignore": "gitignore",
+    ".gitattributes": "gitattributes",
+    "license": "License",
+    "readme": "Readme",
+}
+
+def friendly_type(filename: str, is_binary: bool) -> str:
+    """Human-readable type label for the Files table (e.g. "Python", "Markdown")."""
+    name = filename.lower()
+    root, ext = os.path.splitext(name)
+    label = (_EXT_TYPE_MAP.get(ext)
+             or _NAME_TYPE_MAP.get(name)
+             or (None if ext else _NAME_TYPE_MAP.get(root)))
+    if label:
+        return label
+    return "Binary" if is_binary else "Text"
+
 class FileScanner:
     def __init__(self, base_folder: str):
         self.base_folder = base_folder
@@ -94,26 +150,54 @@ class FileScanner:
 
     def yield_files(self) -> Generator[Tuple[str, str, FileType], None, None]:
         """Yield (filename, relative_path, file_type), deterministically sorted."""
+        for filename, rel_path, file_type, _size, _mtime in self.yield_entries():
+            yield (filename, rel_path, file_type)
+
+    def yield_entries(self) -> Generator[Tuple[str, str, FileType, Optional[int], Optional[float]], None, None]:
+        """
+        Like yield_files(), plus (size, mtime) from the scandir entry so callers
+        don't need another stat per file. Size/mtime are None if stat failed.
+        Walk order matches os.walk(topdown=True) with case-insensitive sorting.
+        """
         try:
-            for root_dir, dirs, files in os.walk(self.base_folder, topdown=True):
-                rel_root = os.path.normpath(os.path.relpath(root_dir, self.base_folder))
-                if rel_root == ".":
-                    rel_root = ""
-
-                # filter dirs in-place (names, explicit rel paths, .gitignore)
-                dirs[:] = [
-                    d for d in dirs
-                    if not self.is_within_excluded_folder(
-                        os.path.normpath(os.path.join(rel_root, d)) if rel_root else d
-                    )
-                ]
-                dirs.sort(key=str.lower)
-
-                for file in sorted(files, key=str.lower):
-                    rel_path = os.path.normpath(os.path.join(rel_root, file)) if rel_root else file
-                    if self.is_file_excluded(file, rel_path):
+            stack = [""]
+            while stack:
+                rel_root = stack.pop()
+                full = os.path.join(self.base_folder, rel_root) if rel_root else self.base_folder
+                try:
+                    with os.scandir(full) as it:
+                        entries = list(it)
+                except OSError:
+                    continue
+
+                dirs, files = [], []
+                for e in entries:
+                    try:
+                        is_dir = e.is_dir()
+                    except OSError:
+                        is_dir = False
+                    (dirs if is_dir else files).append(e)
+
+                # filter dirs (names, explicit rel paths, .gitignore); like os.walk, don't follow links
+                sub_dirs = []
+                for d in sorted(dirs, key=lambda e: e.name.lower()):
+                    rel = os.path.join(rel_root, d.name) if rel_root else d.name
+                    if d.is_symlink() or self.is_within_excluded_folder(rel):
+                        continue
+                    sub_dirs.append(rel)
+
+                for e in sorted(files, key=lambda e: e.name.lower()):
+                    rel_path = os.path.join(rel_root, e.name) if rel_root else e.name
+                    if self.is_file_excluded(e.name, rel_path):
                         continue
-                    yield (file, rel_path, self.get_file_type(file))
+                    try:
+                        st = e.stat()
+                        size, mtime = st.st_size, st.st_mtime
+                    except OSError:
+                        size = mtime = None
+                    yield (e.name, rel_path, self.get_file_type(e.name), size, mtime)
+
+                stack.extend(reversed(sub_dirs))
         except Exception as e:
             logger.error(f"Error scanning files: {e}")
             return
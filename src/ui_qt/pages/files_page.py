@@ -10,42 +10,31 @@ from typing import List, Tuple, Optional, Iterable, TYPE_CHECKING
 if TYPE_CHECKING:
     from src.ui_qt.app_window import MainFluentWindow
 
-from PySide6.QtCore import Qt, QPoint, QUrl
-from PySide6.QtGui import QFont, QTextOption, QAction, QShortcut, QKeySequence, QDesktopServices, QPalette
+from PySide6.QtCore import Qt, QPoint, QUrl, QThreadPool, QTimer
+from PySide6.QtGui import QFont, QAction, QShortcut, QKeySequence, QDesktopServices, QPalette
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFileDialog, QSplitter,
     QTableWidget, QTableWidgetItem, QAbstractItemView, QHeaderView, QMenu,
-    QTextEdit, QProgressBar, QPushButton, QApplication, QCheckBox
+    QProgressBar, QPushButton, QApplication, QCheckBox
 )
 from qfluentwidgets import (
     PrimaryPushButton, PushButton, InfoBar, InfoBarPosition,
     LineEdit, ComboBox, SwitchButton, FluentIcon
 )
 
-# Optional syntax highlighting (graceful if missing)
-try:
-    from pygments import highlight
-    from pygments.lexers import guess_lexer_for_filename
-    from pygments.formatters import HtmlFormatter
-    HAVE_PYGMENTS = True
-except Exception:
-    HAVE_PYGMENTS = False
-
-from src.ui_qt.utils import resource_path
-from src.core.file_scanner import FileScanner
+from src.ui_qt.utils import hr_size, resource_path
+from src.core.file_scanner import FileScanner, FileRow, friendly_type
 from src.core.file_processor import FileProcessor
 from src.core.settings_manager import SettingsManager
-from src.utils.encoding_detector import detect_file_encoding
 from src.utils.prefs import load_prefs, save_prefs
 from src.utils.logger import logger
-from src.config import (
-    EXCLUDED_FOLDER_NAMES_DEFAULT, PREVIEW_CHUNK_SIZE, PREVIEW_MAX_BYTES,
-    PROCESS_MAX_BYTES, WINDOW_TITLE
-)
+from src.config import PROCESS_MAX_BYTES, WINDOW_TITLE
 from src.ui_qt.workers.scan_worker import ScanWorker
 from src.ui_qt.workers.process_worker import ProcessWorker
 from src.ui_qt.workers.tree_worker import TreeWorker
+from src.ui_qt.workers.preview_worker import PreviewJob
 from src.ui_qt.widgets.busy_overlay import BusyOverlay
+from src.ui_qt.widgets.code_preview import CodePreview
 
 def default_output_filename(base_folder: str) -> str:
     base = os.path.basename((base_folder or "").rstrip("\\/")) or "combined_output"
@@ -56,50 +45,11 @@ def default_output_filename(base_folder: str) -> str:
         name += ".txt"
     return name
 
-def hr_size(n: int) -> str:
-    units = ["B","KB","MB","GB","TB"]
-    i = 0
-    f = float(n)
-    while f >= 1024 and i < len(units)-1:
-        f /= 1024.0
-        i += 1
-    return f"{f:.1f} {units[i]}"
+# Bytes that commonly appear in text files (control chars used by text + all of 0x20..0xFF except DEL)
+_TEXTCHARS = bytes({7, 8, 9, 10, 11, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f})
 
 class FilesPage(QWidget):
     """Files + Preview + Actions page."""
-    # ---- Type mapping helpers --------------------------------------------
-    _EXT_TYPE_MAP = {
-        ".py": "Python", ".pyw": "Python",
-        ".pyi": "Python Stubs",
-        ".json": "JSON", ".jsonc": "JSONC",
-        ".toml": "TOML",
-        ".yaml": "YAML", ".yml": "YAML",
-        ".md": "Markdown", ".markdown": "Markdown",
-        ".txt": "Text", ".rst": "reStructuredText",
-        ".ini": "INI", ".cfg": "INI", ".conf": "Config",
-        ".csv": "CSV", ".tsv": "TSV", ".log": "Log",
-        ".xml": "XML",
-        ".html": "HTML", ".htm": "HTML",
-        ".css": "CSS",
-        ".js": "JavaScript", ".mjs": "JavaScript",
-        ".ts": "TypeScript", ".jsx": "JSX", ".tsx": "TSX",
-        ".c": "C", ".h": "C Header",
-        ".cc": "C++", ".cpp": "C++", ".cxx": "C++",
-        ".hpp": "C++ Header", ".hh": "C++ Header",
-        ".cs": "C#", ".java": "Java", ".kt": "Kotlin",
-        ".go": "Go", ".rs": "Rust", ".rb": "Ruby",
-        ".php": "PHP", ".swift": "Swift",
-        ".sh": "Shell", ".ps1": "PowerShell", ".bat": "Batch", ".cmd": "Batch",
-    }
-    _NAME_TYPE_MAP = {
-        "makefile": "Makefile",
-        "dockerfile": "Dockerfile",
-        ".gitignore": "gitignore",
-        ".gitattributes": "gitattributes",
-        "license": "License",
-        "readme": "Readme",
-    }
-
     def __init__(self, appwin: "MainFluentWindow"):
         super().__init__(parent=appwin)
         self.setObjectName("FilesPage")
@@ -111,6 +61,23 @@ class FilesPage(QWidget):
         self.proc_thread: Optional[ProcessWorker] = None
         self.tree_thread: Optional[TreeWorker] = None
         self.last_output_path: Optional[str] = None
+        self._binary_cache: dict[str, bool] = {}
+        self._base_folder = ""      # selected_folder that _base_prefix was built for
+        self._base_prefix = ""
+        # Preview runs on the global thread pool; results from superseded requests are dropped
+        self._preview_gen = 0
+        self._preview_path = ""
+        self._preview_size: Optional[int] = None
+        self._preview_jobs: set[PreviewJob] = set()
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(60)
+        self._preview_timer.timeout.connect(self._start_preview)
+        # Drag/shift selection fires once per row; recompute stats once it settles
+        self._sel_timer = QTimer(self)
+        self._sel_timer.setSingleShot(True)
+        self._sel_timer.setInterval(30)
+        self._sel_timer.timeout.connect(self._do_selection_changed)
         self.overlay = BusyOverlay(self)
         self.overlay.hide()
 
@@ -199,9 +166,16 @@ class FilesPage(QWidget):
 
         self.table = QTableWidget(0, 3, self)
         self.table.setHorizontalHeaderLabels(["Filename", "Path", "Type"])
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
+        # Fixed/interactive sizing: ResizeToContents measures every cell on each batch
+        hdr = self.table.horizontalHeader()
+        hdr.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
+        hdr.setSectionResizeMode(1, QHeaderView.ResizeMode.Stretch)
+        hdr.setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
+        hdr.resizeSection(0, 240)
+        hdr.resizeSection(2, 120)
+        vhdr = self.table.verticalHeader()
+        vhdr.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vhdr.setDefaultSectionSize(max(22, self.table.fontMetrics().height() + 8))
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
@@ -245,8 +219,7 @@ class FilesPage(QWidget):
         right_lay = QVBoxLayout(right); right_lay.setContentsMargins(8, 0, 0, 0)
         prev_title = QLabel("Preview"); prev_title.setStyleSheet("font-weight:600;")
         right_lay.addWidget(prev_title)
-        self.preview = QTextEdit(self); self.preview.setReadOnly(True)
-        self.preview.setWordWrapMode(QTextOption.NoWrap)
+        self.preview = CodePreview(self)
         mono = QFont("Consolas"); mono.setStyleHint(QFont.Monospace)
         self.preview.setFont(mono)
         right_lay.addWidget(self.preview, 1)
@@ -307,7 +280,7 @@ class FilesPage(QWidget):
         self.open_output_btn.clicked.connect(self._open_last_output)
         self.reveal_output_btn.clicked.connect(self._reveal_last_output)
 
-        self.table.itemSelectionChanged.connect(self._on_table_selection_changed)
+        self.table.itemSelectionChanged.connect(self._sel_timer.start)
         self.search_edit.textChanged.connect(self._apply_filter)
         self.ext_filter.textChanged.connect(self._apply_filter)
 
@@ -430,6 +403,7 @@ class FilesPage(QWidget):
             pass
         folder = os.path.abspath(folder)
         self.state.selected_folder = folder
+        self._binary_cache.clear()
         self.state.scanner = FileScanner(folder)
         self.state.processor = FileProcessor(folder)
         self.state.settings_mgr = SettingsManager(folder)
@@ -460,6 +434,7 @@ class FilesPage(QWidget):
 
     def refresh_files(self):
         self._clear_table()
+        self._binary_cache.clear()
         st = self.state
         if not st.scanner or not st.selected_folder:
             self.status.setText("No folder selected.")
@@ -470,12 +445,6 @@ class FilesPage(QWidget):
         except Exception:
             pass
 
-        st.scanner.excluded_folders = set(st.excluded_folders)
-        st.scanner.excluded_file_patterns = set(st.excluded_file_patterns)
-        st.scanner.excluded_files = set(st.excluded_files_abs)
-        st.scanner.apply_gitignore = bool(st.apply_gitignore)
-        st.scanner.excluded_folder_names = set(EXCLUDED_FOLDER_NAMES_DEFAULT) if st.use_default_folder_names else set()
-
         self.progress.setValue(0)
         self.status.setText("Scanning files…")
         self._set_buttons_enabled(False)
@@ -496,15 +465,13 @@ class FilesPage(QWidget):
         self.scan_thread.finishedOk.connect(self._scan_finished)
         self.scan_thread.start()
 
-    def _append_batch(self, rows: list):
+    def _append_batch(self, rows: List[FileRow]):
         sorting = self.table.isSortingEnabled()
         if sorting:
             self.table.setSortingEnabled(False)
+        add = self._add_file_row
         for r in rows:
-            fn, rel, typ = self._coerce_row(r)
-            if not fn:
-                continue
-            self._add_file_row(fn, rel, typ)
+            add(r.name, r.rel, r.typ, r.type_display, r.size, r.mtime, r.path_label)
         if sorting:
             self.table.setSortingEnabled(True)
         self._apply_filter()
@@ -600,7 +567,6 @@ class FilesPage(QWidget):
         rows = [i.row() for i in self.table.selectionModel().selectedRows()]
         total_sel = len(rows)
         total_size = 0
-        base = self.state.selected_folder
         for r in rows:
             name_item = self.table.item(r, 0)
             if not name_item:
@@ -608,9 +574,12 @@ class FilesPage(QWidget):
             rel = name_item.data(Qt.UserRole)
             if rel is None:
                 continue
-            full = os.path.join(base, rel) if base else rel
+            stat = name_item.data(Qt.UserRole + 2)
+            if stat:
+                total_size += stat[0]
+                continue
             try:
-                total_size += os.path.getsize(full)
+                total_size += os.path.getsize(self._abs_path(rel))
             except Exception:
                 pass
         self.sel_stats.setText(f"Selected: {total_sel} | Size: {hr_size(total_size)}")
@@ -883,17 +852,27 @@ class FilesPage(QWidget):
             btn.setEnabled(enabled)
 
     # helpers: table + preview
-    def _add_file_row(self, filename: str, rel_path: str, file_type: str):
-        dir_rel = os.path.dirname(rel_path).replace("\\", "/")
-        path_display = dir_rel if dir_rel not in ("", ".") else "root"
+    def _abs_path(self, rel: str) -> str:
+        """Selected folder + rel by plain concatenation (rel is always relative to it)."""
+        folder = self.state.selected_folder or ""
+        if folder != self._base_folder:
+            self._base_folder = folder
+            self._base_prefix = folder.rstrip(os.sep) + os.sep if folder else ""
+        return self._base_prefix + rel
+
+    def _add_file_row(self, filename: str, rel_path: str, file_type: str, type_display: Optional[str] = None,
+                      size: Optional[int] = None, mtime: Optional[float] = None,
+                      path_display: Optional[str] = None):
+        if path_display is None:
+            dir_rel = os.path.dirname(rel_path).replace("\\", "/")
+            path_display = dir_rel if dir_rel not in ("", ".") else "root"
 
         typ_role = (file_type or "").strip().lower()
         if typ_role not in ("text", "binary"):
-            abs_guess = os.path.join(self.state.selected_folder or "", rel_path)
-            typ_role = "binary" if self._is_binary(abs_guess) else "text"
+            typ_role = "binary" if self._is_binary(self._abs_path(rel_path)) else "text"
 
-        abs_full = os.path.join(self.state.selected_folder or "", rel_path)
-        type_display = self._friendly_type_for(filename, abs_full, typ_role)
+        if type_display is None:
+            type_display = friendly_type(filename, typ_role == "binary")
 
         row = self.table.rowCount()
         self.table.insertRow(row)
@@ -904,6 +883,8 @@ class FilesPage(QWidget):
 
         name_item.setData(Qt.UserRole, rel_path)
         name_item.setData(Qt.UserRole + 1, typ_role)
+        if size is not None:
+            name_item.setData(Qt.UserRole + 2, (size, mtime))
 
         for it in (name_item, path_item, type_item):
             it.setFlags(it.flags() & ~Qt.ItemIsEditable)
@@ -912,7 +893,7 @@ class FilesPage(QWidget):
         self.table.setItem(row, 1, path_item)
         self.table.setItem(row, 2, type_item)
 
-    def _on_table_selection_changed(self):
+    def _do_selection_changed(self):
         self._update_sel_stats()
         row = self.table.currentRow()
         if row < 0:
@@ -930,112 +911,67 @@ class FilesPage(QWidget):
             self._preview_show_text("File not found.")
             return
 
-        base = self.state.selected_folder or ""
-        full_path = os.path.normpath(os.path.join(base, rel_path))
+        full_path = self._abs_path(rel_path)
+        if ".." in full_path:
+            full_path = os.path.normpath(full_path)
 
         if file_type == "binary":
             self._preview_show_text("[ This is a binary file and cannot be previewed. ]")
             return
-        if not os.path.isfile(full_path):
-            self._preview_show_text("File not found.")
-            return
-        self._preview_file(full_path)
-
-    def _is_binary(self, abs_path: str) -> bool:
-        try:
-            with open(abs_path, "rb") as f:
-                return b"\0" in f.read(4096)
-        except Exception:
-            return False
-
-    def _coerce_row(self, row) -> tuple[str, str, str]:
-        fn, rel, typ = "", "", ""
-        if isinstance(row, dict):
-            rel = row.get("rel") or row.get("relative_path") or row.get("path") or ""
-            fn = row.get("name") or (os.path.basename(rel) if rel else "")
-            typ = (row.get("type") or "").lower()
-        elif isinstance(row, (list, tuple)):
-            if len(row) >= 3:
-                a, b, c = row[0], row[1], row[2]
-            elif len(row) == 2:
-                a, b = row[0], row[1]; c = ""
-            else:
-                return "", "", ""
-            if (isinstance(a, str) and (os.sep in a or "/" in a)) and not (os.sep in b or "/" in b):
-                rel = a; fn = b or os.path.basename(a)
-            else:
-                fn = a or os.path.basename(b) if isinstance(b, str) else ""
-                rel = b if isinstance(b, str) else ""
-            typ = (c or "").lower()
-        else:
-            return "", "", ""
-
-        if rel:
-            base = os.path.basename(rel)
-            if base.lower() != fn.lower():
-                rel = os.path.normpath(os.path.join(rel, fn))
+        # Size was captured by the scan; only stat here for rows that lack it
+        stat = name_item.data(Qt.UserRole + 2)
+        if stat:
+            sz = stat[0]
         else:
-            rel = fn
-
-        if not typ:
-            abs_path = os.path.join(self.state.selected_folder or "", rel)
-            typ = "binary" if self._is_binary(abs_path) else "text"
-        return fn, rel, typ
-
-    def _preview_show_text(self, text: str):
-        self.preview.setPlainText(text)
-
-    def _preview_file(self, path: str):
-        try:
             try:
-                sz = os.path.getsize(path)
+                sz = os.stat(full_path).st_size
             except OSError:
-                sz = None
-
-            if sz is not None and sz > PREVIEW_MAX_BYTES:
-                mb = PREVIEW_MAX_BYTES / (1024 * 1024)
-                self._preview_show_text(f"[Preview disabled: file exceeds {mb:.1f} MB]")
-                return
-
-            enc = detect_file_encoding(path) or "utf-8"
-            with open(path, "r", encoding=enc, errors="replace") as f:
-                content = f.read(PREVIEW_CHUNK_SIZE)
-
-            base = os.path.basename(path).lower()
-            ext = os.path.splitext(base)[1].lower()
-            treat_plain = (base == ".gitignore") or (ext in {".txt", ""})
-
-            if not HAVE_PYGMENTS or treat_plain:
-                self._preview_show_text(content)
+                self._preview_show_text("File not found.")
                 return
+        self._preview_file(full_path, sz)
 
+    def _is_binary(self, abs_path: str) -> bool:
+        cached = self._binary_cache.get(abs_path)
+        if cached is not None:
+            return cached
+        try:
+            fd = os.open(abs_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
             try:
-                lexer = guess_lexer_for_filename(path, content)
-            except Exception:
-                self._preview_show_text(content)
-                return
+                buf = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+        except OSError:
+            return False
+        # NUL byte, or >30% of the sniffed prefix outside the text byte set
+        binary = b"\0" in buf or len(buf.translate(None, _TEXTCHARS)) / max(len(buf), 1) > 0.30
+        self._binary_cache[abs_path] = binary
+        return binary
 
+    def _preview_show_text(self, text: str):
+        # Invalidate any pending/in-flight preview so it can't overwrite this text
+        self._preview_timer.stop()
+        self._preview_gen += 1
+        self.preview.show_plain(text)
+
+    def _preview_file(self, path: str, sz: Optional[int] = None):
+        # Debounced: holding an arrow key only previews the row it settles on
+        self._preview_path = path
+        self._preview_size = sz
+        self._preview_timer.start()
+
+    def _start_preview(self):
+        self._preview_gen += 1
+        job = PreviewJob(self._preview_gen, self._preview_path, self._preview_size)
+        job.signals.finished.connect(self._on_preview_ready)
+        self._preview_jobs.add(job)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_preview_ready(self, gen: int, path: str, text: str, spans):
+        self._preview_jobs = {j for j in self._preview_jobs if j.gen != gen}
+        if gen != self._preview_gen:
+            return
+        if spans is None:
+            self.preview.show_plain(text)
+        else:
             dark = self.palette().color(QPalette.Window).lightness() < 128
-            style_name = "monokai" if dark else "friendly"
-            fmt = HtmlFormatter(style=style_name, linenos=True, noclasses=False)
-            css = fmt.get_style_defs('.highlight')
-            css_fix = """
-                .highlight { background: transparent; }
-                .highlight pre { margin: 0; }
-                .linenos { opacity: .6; }
-            """
-            html_code = highlight(content, lexer, fmt)
-            self.preview.setHtml(f"<style>{css}\n{css_fix}</style>{html_code}")
-        except Exception as e:
-            self._preview_show_text(f"Error reading file:\n{e}")
-
-    def _friendly_type_for(self, filename: str, abs_path: str, text_or_binary: str) -> str:
-        name = filename.lower()
-        root, ext = os.path.splitext(name)
-        if ext in self._EXT_TYPE_MAP:
-            return self._EXT_TYPE_MAP[ext]
-        if name in self._NAME_TYPE_MAP:
-            return self._NAME_TYPE_MAP[name]
-        if root in self._NAME_TYPE_MAP and not ext:
-            return self._NAME_TYPE_MAP[root]
-        return "Binary" if text_or_binary == "binary" else "Text"
+            self.preview.show_code(text, spans, dark)
@@ -3,7 +3,7 @@ import logging
 from typing import TYPE_CHECKING
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel
 from qfluentwidgets import ComboBox
-from src.utils.prefs import load_prefs, save_prefs
+from src.utils.prefs import load_prefs, update_pref
 from src.ui_qt.theming import AVAILABLE_THEMES
 
 if TYPE_CHECKING:
@@ -44,14 +44,13 @@ class SettingsPage(QWidget):
 
         prefs = load_prefs()
         theme_pref = prefs.get("theme_mode", "Dark")
-        if theme_pref not in AVAILABLE_THEMES:
+        if self.theme_combo.findText(theme_pref) < 0:
             theme_pref = "Dark"
         self.theme_combo.setCurrentText(theme_pref)
 
         scale_pref = int(prefs.get("ui_scale", 100))
         label = f"{scale_pref}%"
-        items = [self.scale_combo.itemText(i) for i in range(self.scale_combo.count())]
-        if label not in items:
+        if self.scale_combo.findText(label) < 0:
             label = "100%"
         self.scale_combo.setCurrentText(label)
         self._apply_scale_now(label)
@@ -62,9 +61,7 @@ class SettingsPage(QWidget):
     def _on_theme_change(self, name: str):
         log.info("SettingsPage: theme changed to '%s'", name)
         self.appwin.update_theme(name)
-        prefs = load_prefs()
-        prefs["theme_mode"] = name
-        save_prefs(prefs)
+        update_pref("theme_mode", name)
 
     def _apply_scale_now(self, label: str):
         try:
@@ -76,9 +73,8 @@ class SettingsPage(QWidget):
 
     def _on_scale_change(self, label: str):
         self._apply_scale_now(label)
-        prefs = load_prefs()
         try:
-            prefs["ui_scale"] = int(label.strip("%"))
+            pct = int(label.strip("%"))
         except Exception:
-            prefs["ui_scale"] = 100
-        save_prefs(prefs)
+            pct = 100
+        update_pref("ui_scale", pct)
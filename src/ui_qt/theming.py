@@ -1,6 +1,10 @@
 from __future__ import annotations
-from typing import Dict, Optional, List
+from typing import Mapping, Optional, List, Union
+from collections import namedtuple
+from types import MappingProxyType
+import functools
 import logging
+import string
 
 from PySide6.QtWidgets import QWidget, QApplication
 from PySide6.QtGui import QColor
@@ -28,42 +32,53 @@ AVAILABLE_THEMES: List[str] = [
 # Palettes
 # -----------------------------
 
-_LIGHT_VARIANTS: Dict[str, Dict[str, str]] = {
-    "Light": {
-        "bg": "#F4F5F7", "pane": "#F9FAFB", "alt": "#EFF1F4",
-        "grid": "#E1E5EA", "fg": "#111111", "head": "#EFF1F4", "accent": "#2563EB",
-    },
-    "Light – Porcelain": {
-        "bg": "#F0F2F4", "pane": "#FFFFFF", "alt": "#ECEFF1",
-        "grid": "#DDE2E6", "fg": "#121314", "head": "#ECEFF1", "accent": "#2563EB",
-    },
-    "Light – Cement": {
-        "bg": "#ECECEF", "pane": "#FAFAFB", "alt": "#E6E7EA",
-        "grid": "#D8DADE", "fg": "#111213", "head": "#E6E7EA", "accent": "#2563EB",
-    },
-}
-
-_DARK_VARIANTS: Dict[str, Dict[str, str]] = {
-    "Dark": {
-        "page": "#1E1E1E", "alt": "#2A2A2A", "fg": "#EDEDED", "muted": "#A7B0BA",
-        "grid": "#333333", "accent": "#3B82F6", "accent2": "#60A5FA",
-    },
-}
-
-_PAGE_TINTS: Dict[str, Dict[str, str]] = {
-    "Space Black (beta)": {
-        "page": "#0E1113", "alt": "#15191E", "fg": "#E7ECF2", "muted": "#A7B0BA",
-        "grid": "#262C33", "accent": "#3B82F6", "accent2": "#60A5FA",
-    },
-    "Blackhole Black (beta)": {
-        "page": "#000000", "alt": "#0B0C0E", "fg": "#F2F5F7", "muted": "#B6BFC9",
-        "grid": "#23282E", "accent": "#22C55E", "accent2": "#34D399",
-    },
-    "Pitch Black (beta)": {
-        "page": "#050506", "alt": "#0E0F12", "fg": "#FFFFFF", "muted": "#C9CFD6",
-        "grid": "#262A30", "accent": "#8B5CF6", "accent2": "#A78BFA",
-    },
-}
+# Immutable palette records; fields are attribute slots rather than dict keys.
+LightPalette = namedtuple("LightPalette", "bg pane alt grid fg head accent")
+DarkPalette = namedtuple("DarkPalette", "page alt fg muted grid accent accent2")
+
+_LIGHT_VARIANTS: Mapping[str, LightPalette] = MappingProxyType({
+    "Light": LightPalette(
+        bg="#F4F5F7", pane="#F9FAFB", alt="#EFF1F4",
+        grid="#E1E5EA", fg="#111111", head="#EFF1F4", accent="#2563EB",
+    ),
+    "Light – Porcelain": LightPalette(
+        bg="#F0F2F4", pane="#FFFFFF", alt="#ECEFF1",
+        grid="#DDE2E6", fg="#121314", head="#ECEFF1", accent="#2563EB",
+    ),
+    "Light – Cement": LightPalette(
+        bg="#ECECEF", pane="#FAFAFB", alt="#E6E7EA",
+        grid="#D8DADE", fg="#111213", head="#E6E7EA", accent="#2563EB",
+    ),
+})
+
+_DARK_VARIANTS: Mapping[str, DarkPalette] = MappingProxyType({
+    "Dark": DarkPalette(
+        page="#1E1E1E", alt="#2A2A2A", fg="#EDEDED", muted="#A7B0BA",
+        grid="#333333", accent="#3B82F6", accent2="#60A5FA",
+    ),
+})
+
+_PAGE_TINTS: Mapping[str, DarkPalette] = MappingProxyType({
+    "Space Black (beta)": DarkPalette(
+        page="#0E1113", alt="#15191E", fg="#E7ECF2", muted="#A7B0BA",
+        grid="#262C33", accent="#3B82F6", accent2="#60A5FA",
+    ),
+    "Blackhole Black (beta)": DarkPalette(
+        page="#000000", alt="#0B0C0E", fg="#F2F5F7", muted="#B6BFC9",
+        grid="#23282E", accent="#22C55E", accent2="#34D399",
+    ),
+    "Pitch Black (beta)": DarkPalette(
+        page="#050506", alt="#0E0F12", fg="#FFFFFF", muted="#C9CFD6",
+        grid="#262A30", accent="#8B5CF6", accent2="#A78BFA",
+    ),
+})
+
+# Accent colors built once at import instead of on every theme switch
+_SYSTEM_ACCENT = QColor("#2563EB")
+_ACCENTS: Mapping[str, QColor] = MappingProxyType({
+    name: QColor(spec.accent)
+    for name, spec in {**_LIGHT_VARIANTS, **_DARK_VARIANTS, **_PAGE_TINTS}.items()
+})
 
 # -----------------------------
 # Helpers
@@ -100,130 +115,164 @@ def _apply_css(widget: Optional[QWidget], css: str) -> None:
         widget.setAttribute(Qt.WA_StyledBackground, True)
         widget.setStyleSheet(css)
 
+# Window attribute -> page objectName; content rules are scoped under these ids
+_PAGE_OBJECT_NAMES: Mapping[str, str] = MappingProxyType({
+    "files_page": "FilesPage",
+    "exclusions_page": "ExclusionsPage",
+    "settings_page": "SettingsPage",
+    "compare_page": "ComparePage",
+    "about_page": "AboutPage",
+})
+
+def _apply_window_qss(window: QWidget, css: str) -> None:
+    """Sets the combined theme QSS once on the window; pages inherit their scoped rules."""
+    for page in _pages(window):
+        page.setAttribute(Qt.WA_StyledBackground, True)
+    _apply_css(window, css)
+
 def _pages(window: Optional[QWidget]) -> list[QWidget]:
     if not window:
         return []
-    names = ("files_page", "exclusions_page", "settings_page", "compare_page", "about_page")
+    cached = getattr(window, "_cached_pages", None)
+    if cached is not None:
+        return cached
     out = []
-    for n in names:
-        w = getattr(window, n, None)
+    for attr, object_name in _PAGE_OBJECT_NAMES.items():
+        w = getattr(window, attr, None)
         if isinstance(w, QWidget):
+            # The scoped QSS only reaches pages that carry the expected id
+            if w.objectName() != object_name:
+                w.setObjectName(object_name)
             out.append(w)
+    # Pages live as long as the window; cache once all of them exist
+    if len(out) == len(_PAGE_OBJECT_NAMES):
+        window._cached_pages = out
     return out
 
-def _content_dark_css(p: Dict[str, str]) -> str:
-    """QSS for content pages (dark themes)."""
-    return f"""
-QWidget {{ background: {p['page']}; color: {p['fg']}; }}
-QPlainTextEdit, QTextEdit, QTextBrowser,
-QLineEdit, QListWidget, QListView, QTreeWidget, QTreeView,
-QTableWidget, QTableView, QComboBox, QMenu, QDialog {{
-    background: {p['page']}; color: {p['fg']};
-    border: 1px solid {p['grid']}; border-radius: 6px;
-    selection-background-color: {p['accent']}; selection-color: #ffffff;
-}}
-QTableView, QTreeView, QTableWidget {{
-    alternate-background-color: {p['alt']}; gridline-color: {p['grid']};
-}}
-QHeaderView::section {{
-    background: {p['alt']}; color: {p['fg']}; border: 0px;
-    border-bottom: 1px solid {p['grid']}; padding: 6px 8px;
-}}
-"""
-
-def _content_light_css(p: Dict[str, str]) -> str:
-    """QSS for content pages (light themes)."""
-    return f"""
-QWidget {{ background: {p['bg']}; color: {p['fg']}; }}
-QPlainTextEdit, QTextEdit, QTextBrowser,
-QLineEdit, QListWidget, QListView, QTreeWidget, QTreeView,
-QTableWidget, QTableView, QComboBox, QMenu, QDialog {{
-    background: {p['pane']}; color: {p['fg']};
-    border: 1px solid {p['grid']}; border-radius: 6px;
-    selection-background-color: {p['accent']}; selection-color: #ffffff;
-}}
-QTableView, QTreeView, QTableWidget {{
-    alternate-background-color: {p['alt']}; gridline-color: {p['grid']};
-}}
-QHeaderView::section {{
-    background: {p['head']}; color: {p['fg']}; border: 0px;
-    border-bottom: 1px solid {p['grid']}; padding: 6px 8px;
-}}
-"""
+def _scoped(selectors: str, scopes: tuple[str, ...]) -> str:
+    """Prefixes each comma-separated selector with every page id ('#A X, #B X, ...')."""
+    parts = [sel.strip() for sel in selectors.split(",")]
+    return ",\n".join(f"#{scope} {sel}" for scope in scopes for sel in parts)
 
-def _build_main_window_qss(p: Dict[str, str], is_dark: bool) -> str:
+@functools.lru_cache(maxsize=4)
+def _theme_template(scopes: tuple[str, ...]) -> string.Template:
     """
-    NEW: Builds a SINGLE QSS string for the main window (chrome, nav, title).
-    This is more robust than applying styles to individual widgets.
+    The ONE QSS skeleton for every theme: main window chrome (title, nav) plus
+    content page rules scoped by page objectName. Selectors are expanded here,
+    once; colors are left as $placeholders for _build_theme_qss.
     """
-    # Use dark 'page' or light 'bg' for main window background
-    bg = p.get('page', p.get('bg', '#FFFFFF'))
-    alt = p.get('alt', '#EEEEEE')
-    fg = p.get('fg', '#000000')
-    grid = p.get('grid', '#DDDDDD')
-    accent = p.get('accent', '#3B82F6')
-
-    return f"""
+    page_roots = ", ".join(f"#{n}" for n in scopes)
+    inputs = _scoped(
+        "QPlainTextEdit, QTextEdit, QTextBrowser, "
+        "QLineEdit, QListWidget, QListView, QTreeWidget, QTreeView, "
+        "QTableWidget, QTableView, QComboBox, QMenu, QDialog",
+        scopes,
+    )
+
+    return string.Template(f"""
 /* --- Main Window Chrome --- */
 QLabel[styleClass="sectionHeader"] {{
-    background: {alt};
-    color: {fg};
-    border-bottom: 1px solid {grid};
+    background: $alt;
+    color: $fg;
+    border-bottom: 1px solid $grid;
 }}
 QMenu, QToolTip {{
-    background: {alt};
-    color: {fg};
-    border: 1px solid {grid};
+    background: $alt;
+    color: $fg;
+    border: 1px solid $grid;
 }}
 QScrollBar:vertical, QScrollBar:horizontal {{
-    background: {bg};
-    border: 1px solid {grid};
+    background: $bg;
+    border: 1px solid $grid;
 }}
 QScrollBar::handle:vertical, QScrollBar::handle:horizontal {{
-    background: {alt};
+    background: $alt;
     min-width: 24px; min-height: 24px;
-    border: 1px solid {grid};
+    border: 1px solid $grid;
     border-radius: 6px;
 }}
 
 /* --- Title Bar --- */
 FluentTitleBar#titleBar {{
-    background-color: {bg};
-    color: {fg};
+    background-color: $bg;
+    color: $fg;
     border: 0px;
-    border-bottom: 1px solid {grid};
+    border-bottom: 1px solid $grid;
 }}
 #titleBar QLabel, #titleBar QToolButton {{
-    color: {fg};
+    color: $fg;
     background: transparent;
     border: 0;
 }}
 
 /* --- Navigation Bar --- */
 NavigationInterface#navigationInterface {{
-    background-color: {bg};
-    border-right: 1px solid {grid};
+    background-color: $bg;
+    border-right: 1px solid $grid;
 }}
 #navigationInterface NavigationPushButton, #navigationInterface QToolButton {{
     background-color: transparent;
-    color: {fg};
+    color: $fg;
     border: 0;
 }}
 #navigationInterface NavigationPushButton {{
     padding: 6px 10px;
 }}
 #navigationInterface NavigationPushButton:hover, #navigationInterface QToolButton:hover {{
-    background-color: {alt};
+    background-color: $alt;
 }}
 #navigationInterface NavigationPushButton:checked,
 #navigationInterface NavigationPushButton[isActived="true"] {{
-    background-color: {alt};
-    border-left: 3px solid {accent};
+    background-color: $alt;
+    border-left: 3px solid $accent;
 }}
-"""
+
+/* --- Content Pages --- */
+{page_roots},
+{_scoped("QWidget", scopes)} {{ background: $bg; color: $fg; }}
+{inputs} {{
+    background: $pane; color: $fg;
+    border: 1px solid $grid; border-radius: 6px;
+    selection-background-color: $accent; selection-color: #ffffff;
+}}
+{_scoped("QTableView, QTreeView, QTableWidget", scopes)} {{
+    alternate-background-color: $alt; gridline-color: $grid;
+}}
+{_scoped("QHeaderView::section", scopes)} {{
+    background: $head; color: $fg; border: 0px;
+    border-bottom: 1px solid $grid; padding: 6px 8px;
+}}
+""")
+
+def _build_theme_qss(p: Union[LightPalette, DarkPalette], is_dark: bool, scopes: tuple[str, ...]) -> str:
+    """Fills the shared QSS skeleton with one palette; set once on the window."""
+    # Dark palettes use 'page' for all surfaces; light ones have bg/pane/head
+    return _theme_template(scopes).substitute(
+        bg=p.page if is_dark else p.bg,
+        pane=p.page if is_dark else p.pane,
+        head=p.alt if is_dark else p.head,
+        alt=p.alt, fg=p.fg, grid=p.grid, accent=p.accent,
+    )
+
+def _compose(name: str) -> str:
+    """Full window QSS for a theme name."""
+    scopes = tuple(_PAGE_OBJECT_NAMES.values())
+    if name.startswith("Light"):
+        return _build_theme_qss(_LIGHT_VARIANTS.get(name, _LIGHT_VARIANTS["Light"]), False, scopes)
+    return _build_theme_qss(_DARK_VARIANTS.get(name) or _PAGE_TINTS[name], True, scopes)
+
+def _build_all_qss() -> Mapping[str, str]:
+    """Composes every palette theme once; inputs are fixed, so the output never changes."""
+    names = [n for n in AVAILABLE_THEMES if n != "System"]
+    return MappingProxyType({name: _compose(name) for name in names})
+
+_QSS_CACHE = _build_all_qss()
 
 def _peek(label: str, w: QWidget, expect_hex: str | None = None):
     """Debug logger to peek at widget state."""
+    # Copying the window stylesheet back out of Qt is not free; skip unless debugging
+    if not log.isEnabledFor(logging.DEBUG):
+        return
     ss = w.styleSheet() or ""
     head = ss[:180].replace("\n", " ")
     contains = expect_hex in ss if expect_hex else None
@@ -233,7 +282,7 @@ def _peek(label: str, w: QWidget, expect_hex: str | None = None):
         has_mica = bool(getattr(w, "isMicaEffectEnabled")()) if hasattr(w, "isMicaEffectEnabled") else None
     except Exception:
         has_mica = None
-    log.info(
+    log.debug(
         "THEME: %s -> %s(objectName='%s') ss_len=%d mica=%s head='%s'%s",
         label, cname, oname, len(ss), has_mica,
         head,
@@ -250,14 +299,17 @@ def apply_theme_by_name(name: str, window: Optional[QWidget] = None) -> None:
     if not window:
         return
 
+    # Re-applying the same theme would only trigger a full (and visible) restyle
+    if getattr(window, "_last_applied_theme", None) == name:
+        log.info("apply_theme_by_name(name=%s): already applied, skipping", name)
+        return
+
     title_bar = getattr(window, "titleBar", None)
     nav = getattr(window, "navigationInterface", None)
 
     log.info("apply_theme_by_name(name=%s)", name)
 
-    # Clear any prior per-instance styles from window and children
-    for page in _pages(window):
-        _clear_styles(page)
+    # Clear any prior per-instance styles from the chrome; pages carry no sheet of their own
     _clear_styles(title_bar)
     _clear_styles(nav)
     _clear_styles(window)
@@ -271,8 +323,9 @@ def apply_theme_by_name(name: str, window: Optional[QWidget] = None) -> None:
     # Base theme & effects off
     if name == "System":
         setTheme(Theme.AUTO)
-        setThemeColor(QColor("#2563EB"))
+        setThemeColor(_SYSTEM_ACCENT)
         _disable_effects(window)
+        window._last_applied_theme = name
         _peek("window:system", window)
         return
 
@@ -281,17 +334,12 @@ def apply_theme_by_name(name: str, window: Optional[QWidget] = None) -> None:
         setTheme(Theme.LIGHT)
         _disable_effects(window)
         spec = _LIGHT_VARIANTS.get(name, _LIGHT_VARIANTS["Light"])
-        setThemeColor(QColor(spec["accent"]))
+        setThemeColor(_ACCENTS.get(name, _ACCENTS["Light"]))
 
-        # Apply content page styles
-        for page in _pages(window):
-            _apply_css(page, _content_light_css(spec))
+        _apply_window_qss(window, _QSS_CACHE.get(name) or _QSS_CACHE["Light"])
+        window._last_applied_theme = name
 
-        # NEW: Apply ONE stylesheet to the main window for all chrome
-        main_qss = _build_main_window_qss(spec, is_dark=False)
-        _apply_css(window, main_qss)
-        
-        _peek("window:light", window, spec["bg"])
+        _peek("window:light", window, spec.bg)
         return
 
     # Stock Dark
@@ -299,16 +347,12 @@ def apply_theme_by_name(name: str, window: Optional[QWidget] = None) -> None:
         setTheme(Theme.DARK)
         _disable_effects(window)
         spec = _DARK_VARIANTS["Dark"]
-        setThemeColor(QColor(spec["accent"]))
-
-        for page in _pages(window):
-            _apply_css(page, _content_dark_css(spec))
+        setThemeColor(_ACCENTS[name])
 
-        # NEW: Apply ONE stylesheet to the main window
-        main_qss = _build_main_window_qss(spec, is_dark=True)
-        _apply_css(window, main_qss)
+        _apply_window_qss(window, _QSS_CACHE[name])
+        window._last_applied_theme = name
 
-        _peek("window:dark", window, spec["page"])
+        _peek("window:dark", window, spec.page)
         return
 
     # Custom ultra-dark variants
@@ -319,15 +363,10 @@ def apply_theme_by_name(name: str, window: Optional[QWidget] = None) -> None:
 
     setTheme(Theme.DARK) # Base it on dark theme
     _disable_effects(window)
-    setThemeColor(QColor(spec["accent"]))
+    setThemeColor(_ACCENTS[name])
 
-    # Content pages
-    for page in _pages(window):
-        _apply_css(page, _content_dark_css(spec))
+    _apply_window_qss(window, _QSS_CACHE[name])
+    window._last_applied_theme = name
 
-    # NEW: Apply ONE stylesheet to the main window
-    main_qss = _build_main_window_qss(spec, is_dark=True)
-    _apply_css(window, main_qss)
-    
-    _peek(f"window:{name}", window, spec["page"])
+    _peek(f"window:{name}", window, spec.page)
 
@@ -9,3 +9,12 @@ def resource_path(relative_path: str) -> str:
     except Exception:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+def hr_size(n: int) -> str:
+    """Human-readable size ("12.3 KB"); the unit comes from the bit length, no loop."""
+    if n < 1024:
+        return f"{n:.1f} B"
+    u = min(4, (int(n).bit_length() - 1) // 10)
+    return f"{n / (1 << (u * 10)):.1f} {_SIZE_UNITS[u]}"
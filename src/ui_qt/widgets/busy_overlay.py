@@ -1,7 +1,7 @@
 # src/ui_qt/widgets/busy_overlay.py
 from __future__ import annotations
 
-from PySide6.QtCore import Qt, QSize
+from PySide6.QtCore import Qt, QSize, QEvent
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame, QProgressBar
 
 try:
@@ -53,9 +53,23 @@ class BusyOverlay(QFrame):
     def stop(self):
         self.hide()
 
-    def resizeEvent(self, e):
-        super().resizeEvent(e)
+    # Follow the parent's size only while shown. Show/hide events also fire when an
+    # ancestor page is switched away and back, so the filter is paired with them.
+    def showEvent(self, e):
+        if self.parent():
+            self.parent().installEventFilter(self)
         self._reposition()
+        super().showEvent(e)
+
+    def hideEvent(self, e):
+        if self.parent():
+            self.parent().removeEventFilter(self)
+        super().hideEvent(e)
+
+    def eventFilter(self, obj, e):
+        if obj is self.parent() and e.type() == QEvent.Resize:
+            self._reposition()
+        return False
 
     def _reposition(self):
         if not self.parent():
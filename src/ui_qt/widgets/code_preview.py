@@ -0,0 +1,169 @@
+# src/ui_qt/widgets/code_preview.py
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+from PySide6.QtCore import Qt, QRect, QSize
+from PySide6.QtGui import QColor, QFont, QPainter, QPalette, QSyntaxHighlighter, QTextCharFormat
+from PySide6.QtWidgets import QPlainTextEdit, QWidget
+
+try:
+    from pygments.styles import get_style_by_name
+    HAVE_PYGMENTS = True
+except Exception:
+    HAVE_PYGMENTS = False
+
+# Per-line token spans: spans[line] = [(start, length, pygments token type), ...]
+# start/length are UTF-16 code units, which is what QSyntaxHighlighter.setFormat expects.
+LineSpans = List[List[Tuple[int, int, object]]]
+
+
+def _u16len(s: str) -> int:
+    if s.isascii():
+        return len(s)
+    return len(s.encode("utf-16-le")) // 2
+
+
+def tokenize_to_spans(lexer, text: str) -> LineSpans:
+    """Run a Pygments lexer over the whole text once and split tokens into per-line spans."""
+    spans: LineSpans = [[]]
+    col = 0
+    for _pos, ttype, value in lexer.get_tokens_unprocessed(text):
+        parts = value.split("\n")
+        for i, part in enumerate(parts):
+            if i:
+                spans.append([])
+                col = 0
+            if part:
+                n = _u16len(part)
+                spans[-1].append((col, n, ttype))
+                col += n
+    return spans
+
+
+class PygmentsHighlighter(QSyntaxHighlighter):
+    """Applies precomputed Pygments token spans; Qt calls highlightBlock per text block."""
+    def __init__(self, doc):
+        super().__init__(doc)
+        self._spans: Optional[LineSpans] = None
+        self._style = None
+        self._style_name = ""
+        self._formats: dict = {}
+
+    def set_spans(self, spans: Optional[LineSpans], style_name: str = "friendly"):
+        """Set spans for the next setPlainText(); does not rehighlight by itself."""
+        self._spans = spans
+        if spans is not None and HAVE_PYGMENTS and style_name != self._style_name:
+            self._style = get_style_by_name(style_name)
+            self._style_name = style_name
+            self._formats = {}
+
+    def _format_for(self, ttype) -> QTextCharFormat:
+        fmt = self._formats.get(ttype)
+        if fmt is None:
+            fmt = QTextCharFormat()
+            st = self._style.style_for_token(ttype)
+            if st["color"]:
+                fmt.setForeground(QColor("#" + st["color"]))
+            if st["bold"]:
+                fmt.setFontWeight(QFont.Bold)
+            if st["italic"]:
+                fmt.setFontItalic(True)
+            self._formats[ttype] = fmt
+        return fmt
+
+    def highlightBlock(self, text: str) -> None:
+        spans = self._spans
+        if not spans:
+            return
+        n = self.currentBlock().blockNumber()
+        if n >= len(spans):
+            return
+        for start, length, ttype in spans[n]:
+            self.setFormat(start, length, self._format_for(ttype))
+
+
+class _LineNumberArea(QWidget):
+    def __init__(self, editor: "CodePreview"):
+        super().__init__(editor)
+        self._editor = editor
+
+    def sizeHint(self) -> QSize:
+        return QSize(self._editor.line_number_width(), 0)
+
+    def paintEvent(self, e):
+        self._editor._paint_line_numbers(e)
+
+
+class CodePreview(QPlainTextEdit):
+    """
+    Read-only preview: plain text, or text colored by PygmentsHighlighter with a
+    line-number gutter. Much cheaper than laying out highlighted HTML.
+    """
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._line_numbers = False
+        self._gutter = _LineNumberArea(self)
+        self._highlighter = PygmentsHighlighter(self.document())
+        self.blockCountChanged.connect(self._update_gutter_width)
+        self.updateRequest.connect(self._update_gutter)
+        self._update_gutter_width()
+
+    # -- public API -------------------------------------------------------------
+    def show_plain(self, text: str):
+        self._highlighter.set_spans(None)
+        self._line_numbers = False
+        self.setPlainText(text)
+        self._update_gutter_width()
+
+    def show_code(self, text: str, spans: LineSpans, dark: bool):
+        self._highlighter.set_spans(spans, "monokai" if dark else "friendly")
+        self._line_numbers = True
+        self.setPlainText(text)
+        self._update_gutter_width()
+
+    # -- gutter -----------------------------------------------------------------
+    def line_number_width(self) -> int:
+        if not self._line_numbers:
+            return 0
+        digits = len(str(max(1, self.blockCount())))
+        return 14 + self.fontMetrics().horizontalAdvance("9") * digits
+
+    def _update_gutter_width(self, *_):
+        self.setViewportMargins(self.line_number_width(), 0, 0, 0)
+        cr = self.contentsRect()
+        self._gutter.setGeometry(QRect(cr.left(), cr.top(), self.line_number_width(), cr.height()))
+
+    def _update_gutter(self, rect: QRect, dy: int):
+        if dy:
+            self._gutter.scroll(0, dy)
+        else:
+            self._gutter.update(0, rect.y(), self._gutter.width(), rect.height())
+
+    def resizeEvent(self, e):
+        super().resizeEvent(e)
+        cr = self.contentsRect()
+        self._gutter.setGeometry(QRect(cr.left(), cr.top(), self.line_number_width(), cr.height()))
+
+    def _paint_line_numbers(self, event):
+        painter = QPainter(self._gutter)
+        fg = QColor(self.palette().color(QPalette.Text))
+        fg.setAlphaF(0.6)
+        painter.setPen(fg)
+        right = self._gutter.width() - 6
+        line_h = self.fontMetrics().height()
+
+        block = self.firstVisibleBlock()
+        num = block.blockNumber()
+        top = round(self.blockBoundingGeometry(block).translated(self.contentOffset()).top())
+        bottom = top + round(self.blockBoundingRect(block).height())
+        while block.isValid() and top <= event.rect().bottom():
+            if block.isVisible() and bottom >= event.rect().top():
+                painter.drawText(0, top, right, line_h, Qt.AlignRight, str(num + 1))
+            block = block.next()
+            top = bottom
+            bottom = top + round(self.blockBoundingRect(block).height())
+            num += 1
+        painter.end()
@@ -1,15 +1,22 @@
 # src/ui_qt/widgets/diff_view.py
 from __future__ import annotations
 
-from typing import List
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QPalette
+import functools
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import List, Mapping
+from PySide6.QtCore import Qt, QEvent, QRect, QAbstractTableModel, QModelIndex, QSignalBlocker, QThreadPool
+from PySide6.QtGui import (
+    QSyntaxHighlighter, QTextCharFormat, QColor, QFont, QPalette,
+    QTextDocument, QAbstractTextDocumentLayout
+)
 from PySide6.QtWidgets import (
-    QWidget, QTableWidget, QTableWidgetItem, QTextBrowser, QFrame,
+    QWidget, QTableView, QAbstractItemView, QHeaderView, QStyledItemDelegate,
     QStackedLayout, QPlainTextEdit
 )
 
-from src.core.diff_engine import DiffRow, compute_diff, unified_patch
+from src.core.diff_engine import DiffRow, compute_diff
+from src.ui_qt.workers.diff_worker import DiffJob, cached_unified_patch
 
 # Monospace stack
 MONO = 'Consolas, "Cascadia Mono", "Fira Code", ui-monospace, monospace'
@@ -19,70 +26,249 @@ def _rgba(c: QColor) -> str:
     return f"rgba({c.red()},{c.green()},{c.blue()},{c.alpha()})"
 
 
-def _theme_colors(pal: QPalette) -> dict:
+# Both palettes are built once at import; QColor construction is not repeated per render
+_DARK_COLORS: Mapping[str, object] = MappingProxyType(dict(
+    dark=True,
+    add_bg_chip=QColor(46, 160, 67, int(255 * 0.28)),    # green chip
+    del_bg_chip=QColor(248, 81, 73, int(255 * 0.28)),    # red chip
+    chg_bg_chip=QColor(250, 208, 0,  int(255 * 0.26)),   # amber chip
+    gutter_add=QColor(63, 185, 80),                      # green bar
+    gutter_del=QColor(255, 99, 86),                      # red bar
+    gutter_chg=QColor(246, 193, 0),                      # amber bar
+    meta_fg=QColor(120, 170, 255),
+))
+
+_LIGHT_COLORS: Mapping[str, object] = MappingProxyType(dict(
+    dark=False,
+    add_bg_chip=QColor(198, 248, 207, 255),              # soft green
+    del_bg_chip=QColor(255, 205, 205, 255),              # soft red
+    chg_bg_chip=QColor(255, 241, 174, 255),              # soft amber
+    gutter_add=QColor(31, 136, 61),
+    gutter_del=QColor(207, 34, 46),
+    gutter_chg=QColor(157, 118, 0),
+    meta_fg=QColor(9, 105, 218),
+))
+
+
+def _theme_colors(pal: QPalette) -> Mapping[str, object]:
     """Return a small palette that works in both dark and light themes."""
     # detect dark via window color lightness
-    dark = pal.color(QPalette.Window).lightness() < 128
-
-    if dark:
-        add_bg_chip = QColor(46, 160, 67, int(255 * 0.28))   # green chip
-        del_bg_chip = QColor(248, 81, 73, int(255 * 0.28))   # red chip
-        chg_bg_chip = QColor(250, 208, 0,  int(255 * 0.26))  # amber chip
-        gutter_add  = QColor(63, 185, 80)                    # green bar
-        gutter_del  = QColor(255, 99, 86)                    # red bar
-        gutter_chg  = QColor(246, 193, 0)                    # amber bar
-        meta_fg     = QColor(120, 170, 255)
-    else:
-        add_bg_chip = QColor(198, 248, 207, 255)             # soft green
-        del_bg_chip = QColor(255, 205, 205, 255)             # soft red
-        chg_bg_chip = QColor(255, 241, 174, 255)             # soft amber
-        gutter_add  = QColor(31, 136, 61)
-        gutter_del  = QColor(207, 34, 46)
-        gutter_chg  = QColor(157, 118, 0)
-        meta_fg     = QColor(9, 105, 218)
-
-    return dict(
-        dark=dark,
-        add_bg_chip=add_bg_chip,
-        del_bg_chip=del_bg_chip,
-        chg_bg_chip=chg_bg_chip,
-        gutter_add=gutter_add,
-        gutter_del=gutter_del,
-        gutter_chg=gutter_chg,
-        meta_fg=meta_fg,
+    return _DARK_COLORS if pal.color(QPalette.Window).lightness() < 128 else _LIGHT_COLORS
+
+
+@functools.lru_cache(maxsize=2)
+def _inline_css(dark: bool) -> str:
+    """Default stylesheet for the cell documents; styles inline spans only."""
+    colors = _DARK_COLORS if dark else _LIGHT_COLORS
+    add = _rgba(colors["add_bg_chip"])
+    rem = _rgba(colors["del_bg_chip"])
+    chg = _rgba(colors["chg_bg_chip"])
+    return (
+        "pre{margin:0; white-space:pre-wrap; word-wrap:break-word;}"
+        f" .ins,.add,.diff-add,[data-op='ins']{{background:{add};"
+        " border-radius:3px; padding:0 2px; }}"
+        f" .del,.rem,.diff-del,[data-op='del']{{background:{rem};"
+        " border-radius:3px; padding:0 2px; text-decoration:none; }}"
+        f" .rep,.chg,.change,.diff-chg,[data-op='chg']{{background:{chg};"
+        " border-radius:3px; padding:0 2px; }}"
     )
 
 
+@functools.lru_cache(maxsize=8)
+def _diff_cached(left: str, right: str, opts: tuple) -> List[DiffRow]:
+    """compute_diff memoized on (texts, options); rerenders for a mode/theme change are free."""
+    return compute_diff(left, right, **dict(opts))
+
+
 # ---- Unified (git-style) syntax highlighter ----------------------------------
 class UnifiedDiffHighlighter(QSyntaxHighlighter):
-    def __init__(self, doc, colors: dict):
+    def __init__(self, doc, colors: Mapping[str, object]):
         super().__init__(doc)
+        self._build_formats(colors)
+
+    def set_colors(self, colors: Mapping[str, object]):
+        """Swap palettes in place and re-highlight the attached document."""
+        self._build_formats(colors)
+        self.rehighlight()
+
+    def _build_formats(self, colors: Mapping[str, object]):
         self.c = colors
+        # Formats are built once per palette; highlightBlock runs for every line of the patch
+        self._fmt_hunk = QTextCharFormat()
+        self._fmt_hunk.setForeground(colors["meta_fg"])
+        self._fmt_hunk.setFontWeight(QFont.Bold)
+        self._fmt_meta = QTextCharFormat()
+        self._fmt_meta.setForeground(QColor("#6e7781"))
+        self._fmt_add = QTextCharFormat()
+        self._fmt_add.setBackground(colors["add_bg_chip"])
+        self._fmt_del = QTextCharFormat()
+        self._fmt_del.setBackground(colors["del_bg_chip"])
 
     def highlightBlock(self, text: str) -> None:
-        fmt = QTextCharFormat()
-        # Headers and hunk markers
-        if text.startswith("@@"):
-            fmt.setForeground(self.c["meta_fg"])
-            fmt.setFontWeight(QFont.Bold)
-            self.setFormat(0, len(text), fmt)
-            return
-        if text.startswith(("diff ", "index ", "--- ", "+++ ")):
-            fmt.setForeground(QColor("#6e7781"))
-            self.setFormat(0, len(text), fmt)
-            return
-        # Added/Removed (leave foreground default for contrast; tint background lightly)
-        if text.startswith("+") and not text.startswith("+++"):
-            fmt.setBackground(self.c["add_bg_chip"])
-            self.setFormat(0, len(text), fmt)
-            return
-        if text.startswith("-") and not text.startswith("---"):
-            fmt.setBackground(self.c["del_bg_chip"])
-            self.setFormat(0, len(text), fmt)
+        if not text:
             return
+        # Dispatch on the first character; only then look at the full prefix
+        first = text[0]
+        if first == "@":
+            # Hunk markers
+            if text.startswith("@@"):
+                self.setFormat(0, len(text), self._fmt_hunk)
+        elif first == "+":
+            # Added line, or the '+++ ' file header
+            if not text.startswith("+++"):
+                self.setFormat(0, len(text), self._fmt_add)
+            elif text.startswith("+++ "):
+                self.setFormat(0, len(text), self._fmt_meta)
+        elif first == "-":
+            # Removed line, or the '--- ' file header
+            if not text.startswith("---"):
+                self.setFormat(0, len(text), self._fmt_del)
+            elif text.startswith("--- "):
+                self.setFormat(0, len(text), self._fmt_meta)
+        elif first in "di":
+            if text.startswith(("diff ", "index ")):
+                self.setFormat(0, len(text), self._fmt_meta)
         # Context lines unchanged
 
 
+# ---- Side-by-side cell painter -----------------------------------------------
+HTML_ROLE = Qt.UserRole          # inline-highlighted HTML for a text cell
+TAG_ROLE = Qt.UserRole + 1       # DiffRow.tag, drives the gutter color
+
+class DiffTableModel(QAbstractTableModel):
+    """
+    Side-by-side rows served straight from the DiffRow list; the view only asks
+    for the cells it paints, so nothing is built per row up front.
+    """
+    HEADERS = ("L#", "Left", "R#", "Right")
+    _NUM_ALIGN = int(Qt.AlignRight | Qt.AlignVCenter)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[DiffRow] = []
+
+    def set_rows(self, rows: List[DiffRow]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        r = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return "" if r.left_no is None else str(r.left_no)
+            if col == 2:
+                return "" if r.right_no is None else str(r.right_no)
+            return (r.left_text if col == 1 else r.right_text) or ""
+        if role == HTML_ROLE:
+            if col == 1:
+                return r.left_html or ""
+            if col == 3:
+                return r.right_html or ""
+            return None
+        if role == TAG_ROLE:
+            return r.tag
+        if role == Qt.TextAlignmentRole and col in (0, 2):
+            return self._NUM_ALIGN
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+
+class DiffCellDelegate(QStyledItemDelegate):
+    """
+    Paints side-by-side text cells from their HTML plus a colored gutter bar per line
+    tag. Replaces a QTextBrowser widget per cell; laid-out documents are kept in a
+    small LRU so repaints (scrolling, hover, expose) do not re-parse the HTML.
+    """
+    GUTTER_W = 4
+    TEXT_PAD = 12                # gutter + 8px, as the old per-cell stylesheet had
+    DOC_CACHE_SIZE = 256         # a few screens of cells
+
+    def __init__(self, parent: QWidget | None = None):
+        super().__init__(parent)
+        self._css = ""
+        self._docs: OrderedDict = OrderedDict()  # (html, width, font key) -> QTextDocument
+        self._gutter: dict = {}                  # line tag -> gutter bar color
+
+    def set_theme(self, css: str, colors: Mapping[str, object]):
+        """The CSS lives on the documents, so cell HTML carries no <style> block."""
+        if css != self._css:
+            self._css = css
+            self.clear_cache()
+        # Resolved once per theme; paint() is a single dict lookup per cell
+        self._gutter = {
+            "insert": colors["gutter_add"],
+            "delete": colors["gutter_del"],
+            "replace": colors["gutter_chg"],
+        }
+
+    def clear_cache(self):
+        self._docs.clear()
+
+    def _document(self, html: str, font: QFont, width: int) -> QTextDocument:
+        key = (html, width, font.key())
+        doc = self._docs.get(key)
+        if doc is not None:
+            self._docs.move_to_end(key)
+            return doc
+        doc = QTextDocument()
+        doc.setDocumentMargin(2)
+        doc.setDefaultStyleSheet(self._css)
+        doc.setDefaultFont(font)
+        doc.setTextWidth(width)
+        doc.setHtml(f"<pre>{html}</pre>")
+        self._docs[key] = doc
+        if len(self._docs) > self.DOC_CACHE_SIZE:
+            self._docs.popitem(last=False)
+        return doc
+
+    def _text_width(self, option, index) -> int:
+        view = option.widget
+        width = view.columnWidth(index.column()) if isinstance(view, QTableView) else option.rect.width()
+        return max(1, width - self.TEXT_PAD)
+
+    def sizeHint(self, option, index):
+        html = index.data(HTML_ROLE)
+        if html is None:
+            return super().sizeHint(option, index)
+        hint = super().sizeHint(option, index)
+        doc = self._document(html, option.font, self._text_width(option, index))
+        hint.setHeight(max(hint.height(), int(doc.size().height())))
+        return hint
+
+    def paint(self, painter, option, index):
+        html = index.data(HTML_ROLE)
+        if html is None:
+            super().paint(painter, option, index)
+            return
+        r = option.rect
+        painter.save()
+        col = self._gutter.get(index.data(TAG_ROLE))
+        if col is not None:
+            painter.fillRect(QRect(r.left(), r.top(), self.GUTTER_W, r.height()), col)
+
+        doc = self._document(html, option.font, max(1, r.width() - self.TEXT_PAD))
+        painter.translate(r.left() + self.TEXT_PAD, r.top())
+        painter.setClipRect(QRect(0, 0, r.width() - self.TEXT_PAD, r.height()))
+        ctx = QAbstractTextDocumentLayout.PaintContext()
+        ctx.palette.setColor(QPalette.Text, option.palette.color(QPalette.Text))
+        doc.documentLayout().draw(painter, ctx)
+        painter.restore()
+
+
 class DiffView(QWidget):
     """
     Diff viewer with two modes:
@@ -95,19 +281,35 @@ class DiffView(QWidget):
         self._right_text = ""
         self._opts = dict(ignore_ws=True, ignore_case=False, normalize_eol=True, inline=True)
         self._mode = "side"
+        # Unified patches are built on the global thread pool; stale results are dropped
+        self._patch_gen = 0
+        self._diff_jobs: set[DiffJob] = set()
+        # Modes whose widget already shows the current texts; a toggle back is just a page flip
+        self._rendered: set[str] = set()
 
         self._stack = QStackedLayout(self)
 
         # --- side-by-side table
-        self.table = QTableWidget(0, 4, self)
-        self.table.setHorizontalHeaderLabels(["L#", "Left", "R#", "Right"])
+        self._model = DiffTableModel(self)
+        self.table = QTableView(self)
+        self.table.setModel(self._model)
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(False)
         self.table.setWordWrap(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionMode(QTableWidget.NoSelection)
-        self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setStyleSheet(f"QTableWidget {{ font-family: {MONO}; font-size: 13px; }}")
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        # Fixed number columns, stretched text columns: no per-cell measuring on fill
+        hdr = self.table.horizontalHeader()
+        hdr.setSectionResizeMode(0, QHeaderView.Fixed)
+        hdr.setSectionResizeMode(1, QHeaderView.Stretch)
+        hdr.setSectionResizeMode(2, QHeaderView.Fixed)
+        hdr.setSectionResizeMode(3, QHeaderView.Stretch)
+        hdr.resizeSection(0, 68)
+        hdr.resizeSection(2, 68)
+        self.table.setStyleSheet(f"QTableView {{ font-family: {MONO}; font-size: 13px; }}")
+        self._cell_delegate = DiffCellDelegate(self.table)
+        self.table.setItemDelegateForColumn(1, self._cell_delegate)
+        self.table.setItemDelegateForColumn(3, self._cell_delegate)
         self._stack.addWidget(self.table)
 
         # --- unified editor
@@ -115,7 +317,9 @@ class DiffView(QWidget):
         self.unified.setReadOnly(True)
         self.unified.setLineWrapMode(QPlainTextEdit.NoWrap)
         self.unified.setStyleSheet(f"QPlainTextEdit {{ font-family: {MONO}; font-size: 13px; }}")
-        self._highlighter = UnifiedDiffHighlighter(self.unified.document(), _theme_colors(self.palette()))
+        colors = _theme_colors(self.palette())
+        self._theme_key = colors["dark"]     # palette the highlighter was built for
+        self._highlighter = UnifiedDiffHighlighter(self.unified.document(), colors)
         self._stack.addWidget(self.unified)
 
         self._stack.setCurrentIndex(0)  # side-by-side by default
@@ -125,27 +329,51 @@ class DiffView(QWidget):
         mode = (mode or "").lower()
         if mode not in ("side", "unified"):
             mode = "side"
-        if mode != self._mode:
-            self._mode = mode
+        if mode == self._mode:
+            return
+        self._mode = mode
+        if mode in self._rendered:
+            self._stack.setCurrentIndex(1 if mode == "unified" else 0)
+        else:
             self._render_current()
 
     def set_texts(self, left_text: str, right_text: str, **opts):
         self._left_text = left_text or ""
         self._right_text = right_text or ""
+        self._patch_gen += 1
         if opts:
             self._opts.update(opts)
+        self._rendered.clear()
         self._render_current()
 
     def copy_unified_to_clipboard(self, left_name: str = "left", right_name: str = "right"):
         from PySide6.QtWidgets import QApplication
-        txt = unified_patch(self._left_text, self._right_text, left_name, right_name)
+        # Same memo the unified view's job fills, so this is normally a cache hit;
+        # on a miss it is computed here (the clipboard is set as part of the action)
+        txt = cached_unified_patch(self._left_text, self._right_text, left_name, right_name)
         QApplication.clipboard().setText(txt or "")
 
     # -- internals --------------------------------------------------------------
-    def _render_current(self):
+    def changeEvent(self, e):
+        super().changeEvent(e)
+        if e.type() == QEvent.PaletteChange:
+            self._sync_theme()
+
+    def _sync_theme(self) -> Mapping[str, object]:
+        """Current theme colors; the highlighter is only touched when dark/light flips."""
         colors = _theme_colors(self.palette())
-        # refresh unified highlighter with up-to-date palette
-        self._highlighter = UnifiedDiffHighlighter(self.unified.document(), colors)
+        if colors["dark"] != self._theme_key:
+            self._theme_key = colors["dark"]
+            self._highlighter.set_colors(colors)
+            self._cell_delegate.clear_cache()
+            if "side" in self._rendered:
+                # Kept table page: restyle in place, the rows are unchanged
+                self._cell_delegate.set_theme(_inline_css(colors["dark"]), colors)
+                self.table.viewport().update()
+        return colors
+
+    def _render_current(self):
+        colors = self._sync_theme()
 
         if self._mode == "unified":
             self._render_unified()
@@ -153,85 +381,33 @@ class DiffView(QWidget):
             self._render_side(colors)
 
     def _render_unified(self):
-        patch = unified_patch(self._left_text, self._right_text, "left", "right")
-        self.unified.setPlainText(patch)
+        self._patch_gen += 1
+        job = DiffJob(self._patch_gen, self._left_text, self._right_text)
+        job.signals.patchReady.connect(self._on_patch_ready)
+        self._diff_jobs.add(job)
+        QThreadPool.globalInstance().start(job)
+        # Never show the previous texts' patch as if it were current
+        self.unified.setPlainText("Computing diff…")
+        self._rendered.add("unified")
         self._stack.setCurrentIndex(1)
 
-    def _inline_css(self, colors: dict) -> str:
-        """CSS injected into each QTextBrowser to style inline spans only."""
-        add = _rgba(colors["add_bg_chip"])
-        rem = _rgba(colors["del_bg_chip"])
-        chg = _rgba(colors["chg_bg_chip"])
-        return (
-            "<style>"
-            "  pre{margin:0; white-space:pre-wrap; word-wrap:break-word;}"
-            f"  .ins,.add,.diff-add,[data-op='ins']{{background:{add};"
-            "     border-radius:3px; padding:0 2px; }}"
-            f"  .del,.rem,.diff-del,[data-op='del']{{background:{rem};"
-            "     border-radius:3px; padding:0 2px; text-decoration:none; }}"
-            f"  .rep,.chg,.change,.diff-chg,[data-op='chg']{{background:{chg};"
-            "     border-radius:3px; padding:0 2px; }}"
-            "</style>"
-        )
-
-    def _apply_gutter(self, w: QTextBrowser, tag: str, colors: dict):
-        """Color only the gutter (left border) per line tag; keep background transparent."""
-        if tag == "insert":
-            col = colors["gutter_add"]
-        elif tag == "delete":
-            col = colors["gutter_del"]
-        elif tag == "replace":
-            col = colors["gutter_chg"]
-        else:
-            col = None
+    def _on_patch_ready(self, gen: int, patch: str):
+        self._diff_jobs = {j for j in self._diff_jobs if j.gen != gen}
+        if gen != self._patch_gen:
+            return
+        self.unified.setPlainText(patch)
 
-        base = f"font-family:{MONO}; font-size:13px; padding-left:8px; border-left: 4px solid transparent; background: transparent;"
-        if col is not None:
-            w.setStyleSheet(base + f" border-left-color: rgb({col.red()},{col.green()},{col.blue()});")
-        else:
-            w.setStyleSheet(base)
-
-    def _render_side(self, colors: dict):
-        rows = compute_diff(self._left_text, self._right_text, **self._opts)
-        self.table.setRowCount(0)
-        css = self._inline_css(colors)
-
-        for r in rows:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Line numbers
-            lno = QTableWidgetItem("" if r.left_no is None else str(r.left_no))
-            rno = QTableWidgetItem("" if r.right_no is None else str(r.right_no))
-            lno.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            rno.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-
-            # Left cell
-            ltxt = QTextBrowser()
-            ltxt.setFrameShape(QFrame.NoFrame)
-            ltxt.setOpenExternalLinks(False)
-            ltxt.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            ltxt.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            ltxt.setMaximumHeight(1200000)
-            ltxt.setHtml(f"{css}<pre>{(r.left_html or '')}</pre>")
-            self._apply_gutter(ltxt, r.tag, colors)
-
-            # Right cell
-            rtxt = QTextBrowser()
-            rtxt.setFrameShape(QFrame.NoFrame)
-            rtxt.setOpenExternalLinks(False)
-            rtxt.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            rtxt.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-            rtxt.setMaximumHeight(1200000)
-            rtxt.setHtml(f"{css}<pre>{(r.right_html or '')}</pre>")
-            self._apply_gutter(rtxt, r.tag, colors)
-
-            self.table.setItem(row, 0, lno)
-            self.table.setCellWidget(row, 1, ltxt)
-            self.table.setItem(row, 2, rno)
-            self.table.setCellWidget(row, 3, rtxt)
-
-        self.table.resizeColumnsToContents()
-        self.table.setColumnWidth(0, 68)
-        self.table.setColumnWidth(2, 68)
+    def _render_side(self, colors: Mapping[str, object]):
+        rows = _diff_cached(self._left_text, self._right_text, tuple(sorted(self._opts.items())))
+        self._cell_delegate.set_theme(_inline_css(colors["dark"]), colors)
+        table = self.table
+        table.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(table)
+        try:
+            # The model keeps a reference to the rows; cells are produced on demand while painting
+            self._model.set_rows(rows)
+        finally:
+            blocker.unblock()
+            table.setUpdatesEnabled(True)
+        self._rendered.add("side")
         self._stack.setCurrentIndex(0)
@@ -0,0 +1,39 @@
+# src/ui_qt/workers/diff_worker.py
+from __future__ import annotations
+import functools
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+from src.core.diff_engine import unified_patch
+
+@functools.lru_cache(maxsize=8)
+def _unified_patch_cached(left_text: str, right_text: str) -> str:
+    """unified_patch memoized on the two texts; toggling back to unified is a cache hit."""
+    return unified_patch(left_text, right_text, "left", "right")
+
+_DEFAULT_HEADER = "--- left\n+++ right\n"
+
+def cached_unified_patch(left_text: str, right_text: str, left_name: str = "left", right_name: str = "right") -> str:
+    """Memoized patch; other file names only rewrite the two header lines."""
+    patch = _unified_patch_cached(left_text, right_text)
+    if (left_name, right_name) != ("left", "right") and patch.startswith(_DEFAULT_HEADER):
+        patch = f"--- {left_name}\n+++ {right_name}\n" + patch[len(_DEFAULT_HEADER):]
+    return patch
+
+class DiffSignals(QObject):
+    patchReady = Signal(int, str)   # gen, unified patch text
+
+class DiffJob(QRunnable):
+    """Builds the git-style unified patch for the diff view off the UI thread."""
+    def __init__(self, gen: int, left_text: str, right_text: str):
+        super().__init__()
+        self.gen = gen
+        self.left_text = left_text
+        self.right_text = right_text
+        self.signals = DiffSignals()
+
+    def run(self):
+        try:
+            patch = cached_unified_patch(self.left_text, self.right_text)
+        except Exception as e:
+            patch = f"Error computing diff:\n{e}"
+        self.signals.patchReady.emit(self.gen, patch or "")
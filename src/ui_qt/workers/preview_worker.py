@@ -0,0 +1,87 @@
+# src/ui_qt/workers/preview_worker.py
+from __future__ import annotations
+import codecs
+import os
+from typing import Optional
+from PySide6.QtCore import QObject, QRunnable, Signal
+
+# Optional syntax highlighting (graceful if missing)
+try:
+    from pygments.lexers import guess_lexer_for_filename
+    HAVE_PYGMENTS = True
+except Exception:
+    HAVE_PYGMENTS = False
+
+from src.utils.encoding_detector import detect_file_encoding_bytes
+from src.config import PREVIEW_CHUNK_SIZE, PREVIEW_MAX_BYTES, PREVIEW_MAX_LINES, PREVIEW_MAX_LINE_CHARS
+from src.ui_qt.widgets.code_preview import tokenize_to_spans
+
+_TRUNCATED = "\n[... preview truncated ...]"
+
+def _cap_lines(content: str) -> str:
+    """Bound preview text by line count and line length, not just characters."""
+    lines = content.splitlines(keepends=True)
+    truncated = len(lines) > PREVIEW_MAX_LINES
+    capped = []
+    for line in lines[:PREVIEW_MAX_LINES]:
+        if len(line) > PREVIEW_MAX_LINE_CHARS:
+            line = line[:PREVIEW_MAX_LINE_CHARS] + "\n"
+            truncated = True
+        capped.append(line)
+    if not truncated:
+        return content
+    return "".join(capped).rstrip("\n") + "\n" + _TRUNCATED
+
+class PreviewSignals(QObject):
+    finished = Signal(int, str, str, object)   # gen, path, text, line spans (None = plain)
+
+class PreviewJob(QRunnable):
+    """Reads, decodes and tokenizes a file for the preview pane off the UI thread."""
+    def __init__(self, gen: int, path: str, size: Optional[int] = None):
+        super().__init__()
+        self.gen = gen
+        self.path = path
+        self.size = size
+        self.signals = PreviewSignals()
+
+    def run(self):
+        try:
+            text, spans = self._render()
+        except FileNotFoundError:
+            text, spans = "File not found.", None
+        except Exception as e:
+            text, spans = f"Error reading file:\n{e}", None
+        self.signals.finished.emit(self.gen, self.path, text, spans)
+
+    def _render(self):
+        path = self.path
+        # One open serves the size check, encoding sniff and read
+        with open(path, "rb") as f:
+            sz = self.size if self.size is not None else os.fstat(f.fileno()).st_size
+            if sz > PREVIEW_MAX_BYTES:
+                mb = PREVIEW_MAX_BYTES / (1024 * 1024)
+                return f"[Preview disabled: file exceeds {mb:.1f} MB]", None
+            raw = f.read(PREVIEW_CHUNK_SIZE)
+
+        enc = detect_file_encoding_bytes(raw) or "utf-8"
+        try:
+            decoder = codecs.getincrementaldecoder(enc)(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        # final=False drops a character cut in half by the read size;
+        # newlines are normalized as text-mode open() would
+        text = decoder.decode(raw, final=False).replace("\r\n", "\n").replace("\r", "\n")
+        content = _cap_lines(text)
+
+        base = os.path.basename(path).lower()
+        ext = os.path.splitext(base)[1].lower()
+        treat_plain = (base == ".gitignore") or (ext in {".txt", ""})
+
+        if not HAVE_PYGMENTS or treat_plain:
+            return content, None
+
+        try:
+            lexer = guess_lexer_for_filename(path, content)
+        except Exception:
+            return content, None
+        return content, tokenize_to_spans(lexer, content)
@@ -1,5 +1,6 @@
 # src/ui_qt/workers/process_worker.py
 from __future__ import annotations
+import time
 from typing import List, Tuple
 from PySide6.QtCore import QThread, Signal
 
@@ -28,7 +29,15 @@ class ProcessWorker(QThread):
             self.done.emit(False, self.out_path, "Processor not initialized.")
             return
 
+        last_emit = 0.0
+
         def cb(proc, total):
+            # At most ~30 Hz across threads; the final update always goes out
+            nonlocal last_emit
+            now = time.monotonic()
+            if proc < total and now - last_emit < 0.033:
+                return
+            last_emit = now
             self.progress.emit(proc, max(1, total))
             self.status.emit(f"Processing file {proc}/{total}")
 
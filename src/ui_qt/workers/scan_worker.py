@@ -1,14 +1,25 @@
 # src/ui_qt/workers/scan_worker.py
 from __future__ import annotations
-from typing import List, Tuple
+from typing import List
 from PySide6.QtCore import QThread, Signal
+import os
+import sys
 import time
 
-from src.core.file_scanner import FileScanner
+from src.core.file_scanner import FileScanner, FileRow, friendly_type
 from src.config import EXCLUDED_FOLDER_NAMES_DEFAULT
 
+_DEFAULT_FOLDER_NAMES = frozenset(EXCLUDED_FOLDER_NAMES_DEFAULT)
+_NO_FOLDER_NAMES: frozenset = frozenset()
+
+def _snapshot(current, source) -> frozenset:
+    """Frozen copy of a UI-owned set for the scan thread; reuses the last one if unchanged."""
+    if isinstance(current, frozenset) and current == source:
+        return current
+    return frozenset(source)
+
 class ScanWorker(QThread):
-    batch = Signal(list)                 # List[Tuple[str, str, str]]
+    batch = Signal(object)               # List[FileRow], passed by reference
     progress = Signal(int, int)          # processed, total
     status = Signal(str)
     finishedOk = Signal()
@@ -28,33 +39,49 @@ class ScanWorker(QThread):
             self.finishedOk.emit()
             return
 
-        st.scanner.excluded_folders = set(st.excluded_folders)
-        st.scanner.excluded_file_patterns = set(st.excluded_file_patterns)
-        st.scanner.excluded_files = set(st.excluded_files_abs)
-        st.scanner.apply_gitignore = bool(st.apply_gitignore)
-        st.scanner.excluded_folder_names = set(EXCLUDED_FOLDER_NAMES_DEFAULT) if st.use_default_folder_names else set()
+        # The scanner only reads these; the UI keeps mutating its own sets meanwhile
+        sc = st.scanner
+        sc.excluded_folders = _snapshot(sc.excluded_folders, st.excluded_folders)
+        sc.excluded_file_patterns = _snapshot(sc.excluded_file_patterns, st.excluded_file_patterns)
+        sc.excluded_files = _snapshot(sc.excluded_files, st.excluded_files_abs)
+        sc.apply_gitignore = bool(st.apply_gitignore)
+        sc.excluded_folder_names = _DEFAULT_FOLDER_NAMES if st.use_default_folder_names else _NO_FOLDER_NAMES
 
         processed = 0
-        batch: List[Tuple[str, str, str]] = []
+        batch: List[FileRow] = []
+        # Start small so the first rows show up quickly, then grow to amortize signal overhead
         chunk_size = 180
+        max_chunk = 2000
+        last_status = 0.0
+        # One shared "Path" column label per folder rather than a fresh string per row
+        dir_labels: dict[str, str] = {}
 
-        for item in st.scanner.yield_files():
+        for fn, rel, typ, size, mtime in st.scanner.yield_entries():
             if self._stop:
                 self.status.emit("Scan cancelled.")
                 break
-            batch.append(item)
+            # Friendly type, stat info and path label are resolved here so the UI thread only inserts rows
+            dir_rel = os.path.dirname(rel)
+            label = dir_labels.get(dir_rel)
+            if label is None:
+                label = dir_labels[dir_rel] = sys.intern(dir_rel.replace("\\", "/") or "root")
+            batch.append(FileRow(fn, rel, typ, friendly_type(fn, typ == "binary"), size, mtime, label))
             processed += 1
             if len(batch) >= chunk_size:
-                self.batch.emit(batch.copy())
-                batch.clear()
-                # Indeterminate progress during single-pass scan (total=0)
-                self.progress.emit(processed, 0)
-                self.status.emit(f"Scanning… {processed} files")
-                time.sleep(0.003)
+                # Hand the list over as-is and start a fresh one (no copy)
+                self.batch.emit(batch)
+                batch = []
+                chunk_size = min(chunk_size * 2, max_chunk)
+                # Indeterminate progress during single-pass scan (total=0), at most ~20 Hz
+                now = time.monotonic()
+                if now - last_status >= 0.05:
+                    last_status = now
+                    self.progress.emit(processed, 0)
+                    self.status.emit(f"Scanning… {processed} files")
 
         if not self._stop:
             if batch:
-                self.batch.emit(batch.copy())
+                self.batch.emit(batch)
             if processed == 0:
                 self.status.emit("No files found.")
             else:
@@ -1,20 +1,59 @@
 # src/ui_qt/workers/tree_worker.py
 from __future__ import annotations
+import fnmatch
 import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import Optional
 from PySide6.QtCore import QThread, Signal
 from pathspec import PathSpec
 
 from src.core.tree_exporter import TreeExporter
+from src.ui_qt.utils import hr_size
 from src.config import EXCLUDED_FOLDER_NAMES_DEFAULT
 
-def hr_size(n: int) -> str:
-    units = ["B","KB","MB","GB","TB"]
-    i = 0
-    f = float(n)
-    while f >= 1024 and i < len(units)-1:
-        f /= 1024.0
-        i += 1
-    return f"{f:.1f} {units[i]}"
+# .gitignore path -> (mtime, compiled spec); reparsed only when the file changes
+_GITIGNORE_CACHE: dict = {}
+
+def _gitignore_spec(gi: str) -> Optional[PathSpec]:
+    try:
+        mtime = os.stat(gi).st_mtime
+    except OSError:
+        return None
+    hit = _GITIGNORE_CACHE.get(gi)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    try:
+        with open(gi, "r", encoding="utf-8", errors="ignore") as f:
+            spec = PathSpec.from_lines("gitwildmatch", f)
+    except Exception:
+        return None
+    _GITIGNORE_CACHE[gi] = (mtime, spec)
+    return spec
+
+_REPORT_INTERVAL = 0.1         # fallback walk: seconds between status updates
+_WALK_WORKERS = 8               # fallback walk: directories listed concurrently
+
+def _write_text(path: str, text: str) -> None:
+    """
+    Encode once and write straight to the fd, skipping TextIOWrapper. Newlines
+    are translated as text mode would, so output matches TreeExporter's.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    data = memoryview(text.encode("utf-8", "replace"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+def _has_magic(pat: str) -> bool:
+    return any(c in pat for c in "*?[")
 
 class TreeWorker(QThread):
     progress = Signal(int, int)
@@ -28,71 +67,170 @@ class TreeWorker(QThread):
         self.style = style
         self.markdown = markdown
         self.sizes = sizes
+        # Line prefixes by depth, built on demand
+        self._bar, self._leaf = ("|   ", "|-- ") if style == "ascii" else ("│   ", "├── ")
+        self._prefix_cache = [""]
+
+        # File patterns, lowercased once: literal names go in a set, "*.ext" / "name*"
+        # in suffix/prefix tuples (str.endswith/startswith run in C), any other
+        # glob in one compiled union regex
+        pats = self.state.excluded_file_patterns
+        globs = []
+        suffixes, prefixes = [], []
+        self._lit = set()
+        for p in pats:
+            if not _has_magic(p):
+                self._lit.add(p.lower())
+            elif p.startswith("*") and not _has_magic(p[1:]):
+                suffixes.append(p[1:].lower())
+            elif p.endswith("*") and not _has_magic(p[:-1]):
+                prefixes.append(p[:-1].lower())
+            else:
+                globs.append(p)
+        self._suffixes = tuple(suffixes)
+        self._prefixes = tuple(prefixes)
+        self._rel_lit = set(pats)
+        # Excluded folders in the walk's own form (native separators, no trailing one),
+        # so each directory is a single set lookup on the path the walk already built
+        self._excluded_folders = frozenset(
+            os.path.normpath(p).strip(os.sep) for p in self.state.excluded_folders if p
+        )
+        self._pat_re = (
+            re.compile("|".join(fnmatch.translate(p) for p in globs), re.IGNORECASE)
+            if globs else None
+        )
 
         self._git_spec = None
-        gi = os.path.join(self.state.selected_folder or "", ".gitignore")
-        if self.state.apply_gitignore and gi and os.path.isfile(gi):
+        if self.state.apply_gitignore:
+            self._git_spec = _gitignore_spec(os.path.join(self.state.selected_folder or "", ".gitignore"))
+        # Bound matcher for the walk; None (no call at all) without a spec
+        self._ignore_check = self._git_spec.match_file if self._git_spec is not None else None
+
+    def _filtered_walk(self, root: str, report=None):
+        """
+        Top-down walk like os.walk, built on os.scandir; yields (abs dir, rel dir,
+        kept file DirEntries sorted case-insensitively). Directories are listed
+        concurrently on a small thread pool (readdir/stat release the GIL); the
+        results are then yielded in os.walk's depth-first order. While the pool
+        works, report(entries kept so far) is called every _REPORT_INTERVAL.
+        """
+        base = os.path.abspath(root)
+        lock = threading.Lock()
+        finished = threading.Event()
+        pending = 0
+        kept = 0
+
+        def submit(path: str, rel: str):
+            nonlocal pending
+            with lock:
+                pending += 1
+            return pool.submit(task, path, rel)
+
+        def task(path: str, rel: str):
+            nonlocal pending, kept
             try:
-                with open(gi, "r", encoding="utf-8", errors="ignore") as f:
-                    self._git_spec = PathSpec.from_lines("gitwildmatch", f)
-            except Exception:
-                self._git_spec = None
+                listed = self._list_dir(path, rel)
+                if listed is None:
+                    return None
+                subdirs, files = listed
+                with lock:
+                    kept += len(subdirs) + len(files)
+                return path, rel, [submit(p, r) for p, r in subdirs], files
+            finally:
+                with lock:
+                    pending -= 1
+                    if not pending:
+                        finished.set()
 
-    def _ignored_by_git(self, rel_path: str) -> bool:
-        if not self.state.apply_gitignore or not self._git_spec:
-            return False
-        try:
-            return self._git_spec.match_file(rel_path)
-        except Exception:
-            return False
+        with ThreadPoolExecutor(max_workers=_WALK_WORKERS, thread_name_prefix="tree-walk") as pool:
+            stack = [submit(base, "")]
+            # Wait for the whole walk rather than per directory (each such wait would
+            # pay a GIL handoff), waking periodically to report the running count
+            while not finished.wait(_REPORT_INTERVAL):
+                if report is not None:
+                    report(kept)
+        while stack:
+            res = stack.pop().result()
+            if res is None:
+                continue
+            curr, rel_dir, children, files = res
+            yield curr, rel_dir, files
+            # Reversed so subdirectories are visited in listing order
+            stack.extend(reversed(children))
 
-    def _filtered_walk(self, root: str):
+    def _list_dir(self, curr: str, rel_dir: str):
+        """
+        List and filter one directory: (kept subdirs as (abs, rel), kept file
+        DirEntries), or None if it cannot be read. Relative paths are built by
+        plain concatenation as the walk descends, so no join/normpath/relpath
+        runs per entry.
+        """
         st = self.state
-        base = os.path.abspath(root)
-        for curr, dirs, files in os.walk(base):
-            rel_dir = os.path.relpath(curr, base)
-            if rel_dir == ".":
-                rel_dir = ""
-
-            dirs[:] = [
-                d for d in dirs
-                if not (
-                    (st.use_default_folder_names and d in EXCLUDED_FOLDER_NAMES_DEFAULT) or
-                    ((os.path.normpath(os.path.join(rel_dir, d)) if rel_dir else d) in st.excluded_folders) or
-                    self._ignored_by_git(os.path.normpath(os.path.join(rel_dir, d)) if rel_dir else d)
-                )
-            ]
-
-            keep_files = []
-            for f in files:
-                rel_file = os.path.normpath(os.path.join(rel_dir, f)) if rel_dir else f
-                abs_f = os.path.join(curr, f)
-
-                if self._ignored_by_git(rel_file):
-                    continue
-                if abs_f in st.excluded_files_abs:
-                    continue
-
-                skip = False
-                for pat in st.excluded_file_patterns:
-                    ln = f.lower()
-                    if pat.startswith("*.") and ln.endswith(pat[1:].lower()):
-                        skip = True; break
-                    if pat.endswith("*") and ln.startswith(pat[:-1].lower()):
-                        skip = True; break
-                    if pat.startswith("*") and ln.endswith(pat[1:].lower()):
-                        skip = True; break
-                    if pat == f or pat == rel_file:
-                        skip = True; break
-                if not skip:
-                    keep_files.append(f)
-            yield curr, dirs, keep_files
+        sep = os.sep
+        ignored = self._ignore_check
+        dirs, entries = [], []
+        try:
+            with os.scandir(curr) as it:
+                for e in it:
+                    try:
+                        is_dir = e.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if not is_dir:
+                        entries.append(e)
+                    elif not e.is_symlink():      # like os.walk: symlinked dirs are not descended
+                        dirs.append(e)
+        except OSError:
+            return None
+
+        # Prune here so an excluded directory's subtree is never listed or matched;
+        # cheap set lookups first, the gitignore spec last
+        subdirs = []
+        for e in dirs:
+            d = e.name
+            if st.use_default_folder_names and d in EXCLUDED_FOLDER_NAMES_DEFAULT:
+                continue
+            rel_d = rel_dir + sep + d if rel_dir else d
+            if rel_d in self._excluded_folders:
+                continue
+            # Trailing slash so directory-only rules ("build/") apply
+            if ignored is not None and ignored(rel_d + "/"):
+                continue
+            subdirs.append((e.path, rel_d))
+
+        keep_files = []
+        for e in entries:
+            f = e.name
+            rel_file = rel_dir + sep + f if rel_dir else f
+
+            if ignored is not None and ignored(rel_file):
+                continue
+            if e.path in st.excluded_files_abs:
+                continue
+
+            ln = f.lower()
+            if ln in self._lit or rel_file in self._rel_lit:
+                continue
+            if ln.endswith(self._suffixes) or ln.startswith(self._prefixes):
+                continue
+            if self._pat_re is not None and self._pat_re.match(ln):
+                continue
+            if self.sizes:
+                try:
+                    e.stat()                      # cached on the entry for the writer
+                except OSError:
+                    pass
+            keep_files.append((ln, e))
+        # Sort on the lowercased names computed for the pattern checks above
+        keep_files.sort(key=itemgetter(0))
+        return subdirs, [e for _, e in keep_files]
 
     def _prefix(self, depth: int) -> str:
-        if self.style == "ascii":
-            return "|   " * (depth - 1) + ("|-- " if depth > 0 else "")
-        else:
-            return "│   " * (depth - 1) + ("├── " if depth > 0 else "")
+        cache = self._prefix_cache
+        while len(cache) <= depth:
+            d = len(cache)
+            cache.append(self._bar * (d - 1) + self._leaf)
+        return cache[depth]
 
     def run(self):
         st = self.state
@@ -108,7 +246,15 @@ class TreeWorker(QThread):
                 )
                 total = max(1, exporter.count_nodes())
 
+                last_emit = 0.0
+
                 def cb(done, tot):
+                    # At most ~60 Hz across threads; the final update always goes out
+                    nonlocal last_emit
+                    now = time.monotonic()
+                    if done < tot and now - last_emit < 0.016:
+                        return
+                    last_emit = now
                     self.progress.emit(done, max(1, tot))
                     self.status.emit(f"Generating tree {done}/{tot}")
 
@@ -130,42 +276,38 @@ class TreeWorker(QThread):
                 used_fallback = True
 
             if used_fallback:
+                # One traversal builds the lines, then a single write; the walk
+                # reports a running count while directories are being listed
                 base = os.path.abspath(st.selected_folder)
-                total = 0
-                for _, _, files in self._filtered_walk(base):
-                    total += 1 + len(files)
-                total = max(1, total)
-
-                done = 0
-                with open(self.out_path, "w", encoding="utf-8", errors="replace") as w:
-                    if self.markdown:
-                        w.write("```text\n")
-
-                    w.write(os.path.basename(base) + "/\n")
-                    done += 1; self.progress.emit(done, total)
-
-                    for curr, dirs, files in self._filtered_walk(base):
-                        if curr != base:
-                            depth = len(os.path.relpath(curr, base).split(os.sep))
-                            w.write(self._prefix(depth) + os.path.basename(curr) + "/\n")
-                            done += 1; self.progress.emit(done, total)
-
-                        for f in sorted(files, key=str.lower):
-                            p = os.path.join(curr, f)
-                            depth = (len(os.path.relpath(curr, base).split(os.sep)) if curr != base else 0) + 1
-                            if self.sizes:
-                                try:
-                                    s = os.path.getsize(p)
-                                    line = f"{self._prefix(depth)}{f} ({hr_size(s)})\n"
-                                except Exception:
-                                    line = f"{self._prefix(depth)}{f}\n"
-                            else:
-                                line = f"{self._prefix(depth)}{f}\n"
-                            w.write(line)
-                            done += 1; self.progress.emit(done, total)
-
-                    if self.markdown:
-                        w.write("```\n")
+                lines = ["```text\n"] if self.markdown else []
+                lines.append(os.path.basename(base) + "/\n")
+
+                def report(n):
+                    self.status.emit(f"Generating tree… {n} entries")
+
+                for _curr, rel_dir, files in self._filtered_walk(base, report):
+                    depth = 0
+                    if rel_dir:
+                        depth = rel_dir.count(os.sep) + 1
+                        lines.append(self._prefix(depth) + rel_dir.rpartition(os.sep)[2] + "/\n")
+
+                    pre = self._prefix(depth + 1)
+                    for e in files:
+                        f = e.name
+                        if self.sizes:
+                            try:
+                                s = e.stat().st_size
+                                line = f"{pre}{f} ({hr_size(s)})\n"
+                            except Exception:
+                                line = f"{pre}{f}\n"
+                        else:
+                            line = f"{pre}{f}\n"
+                        lines.append(line)
+
+                if self.markdown:
+                    lines.append("```\n")
+                _write_text(self.out_path, "".join(lines))
+                self.progress.emit(len(lines), len(lines))
 
             self.done.emit(True, self.out_path, "")
         except Exception as e:
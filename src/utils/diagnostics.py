@@ -2,13 +2,28 @@
 from __future__ import annotations
 import json
 import os
+import shutil
 from pathlib import Path
-from zipfile import ZipFile, ZIP_DEFLATED
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
 from platformdirs import user_log_dir, user_config_dir
 
 APP_NAME = "Code Combiner for LLMs"
 APP_AUTHOR = "AshutoshVijay"
 
+_COPY_BUFSIZE = 1024 * 1024
+
+def _add_file(z: ZipFile, src: Path, arcname: str) -> None:
+    """Stream a file into the archive in 1 MB chunks (zip64-safe for large logs)."""
+    info = ZipInfo.from_file(src, arcname)
+    info.compress_type = z.compression
+    # ZipFile.open() takes the level from the ZipInfo, not the archive
+    if hasattr(ZipInfo, "compress_level"):      # Python 3.13+
+        info.compress_level = z.compresslevel
+    else:
+        info._compresslevel = z.compresslevel
+    with open(src, "rb") as fsrc, z.open(info, "w", force_zip64=True) as fdst:
+        shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+
 def build_diagnostics_zip(dest_zip_path: str, extra_files: list[str] | None = None) -> str:
     """Create a diagnostics zip (logs + prefs + settings pointers). Returns path."""
     dest = Path(dest_zip_path)
@@ -18,11 +33,12 @@ def build_diagnostics_zip(dest_zip_path: str, extra_files: list[str] | None = No
     cfg_dir = Path(user_config_dir(appname=APP_NAME, appauthor=APP_AUTHOR))
     prefs = cfg_dir / "prefs.json"
 
-    with ZipFile(dest, "w", compression=ZIP_DEFLATED) as z:
+    # Level 1: logs are highly compressible text, the default level mostly costs time
+    with ZipFile(dest, "w", compression=ZIP_DEFLATED, compresslevel=1) as z:
         # Logs
         if log_dir.exists():
             for p in log_dir.glob("*.log"):
-                z.write(p, f"logs/{p.name}")
+                _add_file(z, p, f"logs/{p.name}")
         # Prefs
         if prefs.exists():
             z.write(prefs, "prefs.json")
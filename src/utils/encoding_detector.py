@@ -1,11 +1,73 @@
 # src/utils/encoding_detector.py
 
+import codecs
+import functools
+import os
 import chardet
 from src.utils.logger import logger
 
+# Optional C implementation of chardet (same detect() API, much faster)
+try:
+    import cchardet
+    HAVE_CCHARDET = True
+except Exception:
+    HAVE_CCHARDET = False
+
+_detect = cchardet.detect if HAVE_CCHARDET else chardet.detect
+
+_SNIFF_BYTES = 4096          # one page; enough for BOM / ASCII / UTF-8 checks
+_SNIFF_MAX_BYTES = 10000     # re-read up to this much when chardet is unsure
+_MIN_CONFIDENCE = 0.5
+
+def _sniff(raw: bytes):
+    """(encoding, confident) for a leading chunk of a file."""
+    # BOMs are definitive
+    if raw.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig', True
+    # UTF-32 first: the UTF-16 LE BOM (FF FE) is a prefix of the UTF-32 LE one
+    if raw.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):
+        return 'utf-32', True
+    if raw.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16', True
+    # Pure ASCII (checked in C); utf-8 also covers non-ASCII past the sniffed prefix
+    if raw.isascii():
+        return 'utf-8', True
+    # Fast path: UTF-8 is common; if it decodes, use it without chardet.
+    # Incremental decode tolerates a multi-byte sequence cut off by the read size.
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(raw, final=False)
+        return 'utf-8', True
+    except Exception:
+        pass
+    result = _detect(raw)
+    return result.get('encoding') or 'utf-8', (result.get('confidence') or 0) >= _MIN_CONFIDENCE
+
+def detect_file_encoding_bytes(raw: bytes) -> str:
+    """
+    Detect the encoding of an already-read prefix of a file.
+
+    Args:
+        raw (bytes): Leading bytes of the file (may end mid-character)
+
+    Returns:
+        str: Detected encoding or 'utf-8' as fallback
+    """
+    return _sniff(raw)[0]
+
+@functools.lru_cache(maxsize=4096)
+def _detect_cached(file_path: str, mtime_ns: int, size: int) -> str:
+    # mtime/size are only part of the cache key: an edited file misses the cache
+    with open(file_path, 'rb', buffering=0) as f:
+        raw = f.read(_SNIFF_BYTES)
+        enc, confident = _sniff(raw)
+        if not confident and len(raw) == _SNIFF_BYTES:
+            raw += f.read(_SNIFF_MAX_BYTES - _SNIFF_BYTES)
+            enc, _ = _sniff(raw)
+    return enc
+
 def detect_file_encoding(file_path: str) -> str:
     """
-    Detect the encoding of a file.
+    Detect the encoding of a file. Results are memoized per (path, mtime, size).
     
     Args:
         file_path (str): Path to the file
@@ -14,17 +76,8 @@ def detect_file_encoding(file_path: str) -> str:
         str: Detected encoding or 'utf-8' as fallback
     """
     try:
-        with open(file_path, 'rb') as f:
-            raw = f.read(10000)  # Read first 10KB
-        # Fast path: UTF-8 is common; if it decodes, use it without chardet
-        try:
-            raw.decode('utf-8')
-            return 'utf-8'
-        except Exception:
-            pass
-        result = chardet.detect(raw)
-        enc = result.get('encoding') or 'utf-8'
-        return enc
+        st = os.stat(file_path)
+        return _detect_cached(file_path, st.st_mtime_ns, st.st_size)
     except Exception as e:
         logger.error(f"Failed to detect encoding for {file_path}: {str(e)}")
         return 'utf-8'
@@ -1,29 +1,123 @@
 # src/utils/prefs.py
 
+import atexit
+import copy
 import json
+import os
 from pathlib import Path
+from typing import Any, Optional
 from platformdirs import user_config_dir
 
+# Optional fast JSON parser
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
+# Optional Qt (debounced writes need an event loop; without one we write through)
+try:
+    from PySide6.QtCore import QCoreApplication, QThread, QTimer
+    HAVE_QT = True
+except Exception:
+    HAVE_QT = False
+
 APP_NAME = "Code Combiner for LLMs"
 APP_AUTHOR = "AshutoshVijay"
 
+_FLUSH_DELAY_MS = 250
+
+# In-memory copy of prefs.json; loaded once, written back on a debounce
+_CACHE: Optional[dict] = None
+_CACHE_MTIME: Optional[int] = None   # st_mtime_ns of prefs.json when _CACHE was read/written
+_DIRTY = False
+_LAST_SAVED: Optional[str] = None     # JSON last written (or read) by this process
+_flush_timer = None
+
 def _prefs_path() -> Path:
     cfg_dir = Path(user_config_dir(appname=APP_NAME, appauthor=APP_AUTHOR))
     cfg_dir.mkdir(parents=True, exist_ok=True)
     return cfg_dir / "prefs.json"
 
+def _mtime(p: Path) -> Optional[int]:
+    try:
+        return p.stat().st_mtime_ns
+    except OSError:
+        return None
+
+def _read_from_disk(p: Path) -> dict:
+    try:
+        raw = p.read_bytes()
+    except OSError:
+        return {}
+    try:
+        data = orjson.loads(raw) if HAVE_ORJSON else json.loads(raw)
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
 def load_prefs() -> dict:
+    """
+    Deep copy of the preferences (callers may mutate nested lists/dicts). Served
+    from memory; prefs.json is re-read only when its mtime changed (e.g. edited by
+    another instance) and nothing is pending.
+    """
+    global _CACHE, _CACHE_MTIME, _LAST_SAVED
+    if _DIRTY and _CACHE is not None:
+        return copy.deepcopy(_CACHE)
     p = _prefs_path()
-    if p.exists():
-        try:
-            return json.loads(p.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
+    mtime = _mtime(p)
+    if _CACHE is None or mtime != _CACHE_MTIME:
+        _CACHE = _read_from_disk(p) if mtime is not None else {}
+        _CACHE_MTIME = mtime
+        _LAST_SAVED = json.dumps(_CACHE, separators=(",", ":"))
+    return copy.deepcopy(_CACHE)
 
 def save_prefs(data: dict) -> None:
+    global _CACHE, _DIRTY
+    _CACHE = copy.deepcopy(data)          # later edits to data must not leak in
+    _DIRTY = True
+    _schedule_flush()
+
+def update_pref(key: str, value: Any) -> None:
+    """Set a single preference (replaces the load/modify/save triad)."""
+    prefs = load_prefs()
+    prefs[key] = value
+    save_prefs(prefs)
+
+def flush_prefs() -> None:
+    """Write pending preference changes to disk now (no-op when nothing changed)."""
+    global _DIRTY, _LAST_SAVED, _CACHE_MTIME
+    if not _DIRTY or _CACHE is None:
+        return
+    _DIRTY = False
+    text = json.dumps(_CACHE, separators=(",", ":"))
+    if text == _LAST_SAVED:
+        return
     p = _prefs_path()
+    tmp = p.with_suffix(".json.tmp")
     try:
-        p.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        # Write-then-rename: a crash mid-write never leaves a truncated prefs.json
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, p)
+        _LAST_SAVED = text
+        _CACHE_MTIME = _mtime(p)
     except Exception:
         pass
+
+def _schedule_flush() -> None:
+    global _flush_timer
+    app = QCoreApplication.instance() if HAVE_QT else None
+    if app is None or QThread.currentThread() is not app.thread():
+        flush_prefs()
+        return
+    if _flush_timer is None:
+        _flush_timer = QTimer(app)
+        _flush_timer.setSingleShot(True)
+        _flush_timer.setInterval(_FLUSH_DELAY_MS)
+        _flush_timer.timeout.connect(flush_prefs)
+        app.aboutToQuit.connect(flush_prefs)
+    _flush_timer.start()
+
+# Last resort for changes made after the event loop has stopped
+atexit.register(flush_prefs)
@@ -0,0 +1,34 @@
+import unittest
+
+try:
+    from pygments.lexers import PythonLexer
+    from pygments.token import Name
+    HAVE_PYGMENTS = True
+except Exception:
+    HAVE_PYGMENTS = False
+
+from src.ui_qt.widgets.code_preview import tokenize_to_spans
+
+
+@unittest.skipUnless(HAVE_PYGMENTS, "pygments not installed")
+class TestTokenizeToSpans(unittest.TestCase):
+    def _name_cols(self, line_spans):
+        return [(start, length) for start, length, ttype in line_spans if ttype in Name]
+
+    def test_ascii_columns(self):
+        text = 'x = "a"; y = 1\n'
+        spans = tokenize_to_spans(PythonLexer(), text)
+        self.assertEqual(self._name_cols(spans[0]), [(0, 1), (9, 1)])
+
+    def test_columns_counted_in_utf16_units(self):
+        # The emoji is one code point but two UTF-16 units, so "y" sits one column later
+        text = 'x = "\U0001F600"; y = 1\nz = 2\n'
+        spans = tokenize_to_spans(PythonLexer(), text)
+        self.assertEqual(self._name_cols(spans[0]), [(0, 1), (10, 1)])
+        # The emoji's own token covers both surrogate units
+        self.assertIn((5, 2), [(start, length) for start, length, _t in spans[0]])
+        self.assertEqual(self._name_cols(spans[1]), [(0, 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
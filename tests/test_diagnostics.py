@@ -0,0 +1,43 @@
+import unittest
+import random
+import shutil
+from pathlib import Path
+from zipfile import ZipFile, ZIP_DEFLATED
+
+from src.utils.diagnostics import _add_file
+
+
+class TestDiagnosticsZip(unittest.TestCase):
+    def setUp(self):
+        self.base = Path("tests/_tmp_diag")
+        if self.base.exists():
+            shutil.rmtree(self.base)
+        self.base.mkdir(parents=True)
+        rnd = random.Random(0)
+        words = ["alpha", "beta", "gamma", "delta", "scan", "file", "error", "ok"]
+        lines = (f"{i} {' '.join(rnd.choice(words) for _ in range(8))}\n" for i in range(50000))
+        self.log = self.base / "app.log"
+        self.log.write_text("".join(lines), encoding="utf-8")
+
+    def tearDown(self):
+        if self.base.exists():
+            shutil.rmtree(self.base)
+
+    def _compressed_size(self, level: int, streamed: bool) -> int:
+        dest = self.base / f"out_{level}_{streamed}.zip"
+        with ZipFile(dest, "w", compression=ZIP_DEFLATED, compresslevel=level) as z:
+            if streamed:
+                _add_file(z, self.log, "logs/app.log")
+            else:
+                z.write(self.log, "logs/app.log")
+        with ZipFile(dest) as z:
+            self.assertEqual(z.read("logs/app.log"), self.log.read_bytes())
+            return z.getinfo("logs/app.log").compress_size
+
+    def test_streamed_log_uses_archive_compresslevel(self):
+        self.assertEqual(self._compressed_size(1, True), self._compressed_size(1, False))
+        self.assertNotEqual(self._compressed_size(1, True), self._compressed_size(9, True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+import unittest
+import codecs
+import os
+import shutil
+import time
+from pathlib import Path
+from unittest import mock
+
+from src.utils import encoding_detector
+from src.utils.encoding_detector import detect_file_encoding, detect_file_encoding_bytes
+
+
+class TestEncodingDetector(unittest.TestCase):
+    def setUp(self):
+        self.base = Path("tests/_tmp_enc")
+        if self.base.exists():
+            shutil.rmtree(self.base)
+        self.base.mkdir(parents=True)
+        encoding_detector._detect_cached.cache_clear()
+
+    def tearDown(self):
+        if self.base.exists():
+            shutil.rmtree(self.base)
+
+    def _write(self, name: str, data: bytes) -> str:
+        p = self.base / name
+        p.write_bytes(data)
+        return str(p)
+
+    def test_boms(self):
+        text = "hello world\n"
+        cases = {
+            "utf-8-sig": codecs.BOM_UTF8 + text.encode("utf-8"),
+            "utf-16": text.encode("utf-16"),
+            "utf-32": text.encode("utf-32"),
+        }
+        for expected, data in cases.items():
+            self.assertEqual(detect_file_encoding_bytes(data), expected)
+            path = self._write(f"{expected}.txt", data)
+            enc = detect_file_encoding(path)
+            self.assertEqual(enc, expected)
+            with open(path, "r", encoding=enc) as f:
+                self.assertEqual(f.read(), text)
+        # Big-endian BOMs
+        self.assertEqual(detect_file_encoding_bytes(codecs.BOM_UTF16_BE + b"\x00x"), "utf-16")
+        self.assertEqual(detect_file_encoding_bytes(codecs.BOM_UTF32_BE + b"\x00\x00\x00x"), "utf-32")
+
+    def test_ascii_prefix_is_utf8(self):
+        path = self._write("ascii.py", b"print('hi')\n" * 100)
+        self.assertEqual(detect_file_encoding(path), "utf-8")
+
+    def test_utf8_sequence_cut_at_read_size(self):
+        # 4095 ASCII bytes, then a 2-byte character split by the 4096-byte read
+        data = b"a" * 4095 + "é".encode("utf-8") + b"tail\n"
+        path = self._write("split.txt", data)
+        self.assertEqual(detect_file_encoding(path), "utf-8")
+
+    def test_cp1251(self):
+        text = "Привет, мир! Это проверка кодировки текста. " * 40
+        path = self._write("ru.txt", text.encode("cp1251"))
+        enc = detect_file_encoding(path)
+        with open(path, "r", encoding=enc) as f:
+            self.assertEqual(f.read(), text)
+
+    def test_low_confidence_rereads_up_to_10kb(self):
+        path = self._write("latin.txt", "café ".encode("latin-1") * 3000)
+        seen = []
+
+        def fake_detect(raw):
+            seen.append(len(raw))
+            return {"encoding": "ISO-8859-1", "confidence": 0.2 if len(seen) == 1 else 0.9}
+
+        with mock.patch.object(encoding_detector, "_detect", fake_detect):
+            self.assertEqual(detect_file_encoding(path), "ISO-8859-1")
+        self.assertEqual(seen, [4096, 10000])
+
+    def test_cache_misses_after_edit(self):
+        path = self._write("edit.txt", b"plain ascii\n")
+        self.assertEqual(detect_file_encoding(path), "utf-8")
+        self.assertEqual(detect_file_encoding(path), "utf-8")
+        info = encoding_detector._detect_cached.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+        time.sleep(0.01)
+        Path(path).write_bytes("edited\n".encode("utf-16"))
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+        self.assertEqual(detect_file_encoding(path), "utf-16")
+        self.assertEqual(encoding_detector._detect_cached.cache_info().misses, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,7 +3,7 @@ import os
 import shutil
 from pathlib import Path
 
-from src.core.file_scanner import FileScanner
+from src.core.file_scanner import FileScanner, friendly_type
 
 
 class TestFileScanner(unittest.TestCase):
@@ -43,6 +43,14 @@ class TestFileScanner(unittest.TestCase):
         # keep Python file present
         self.assertIn("src/keep.py", rels)
 
+    def test_friendly_type(self):
+        self.assertEqual(friendly_type("main.PY", False), "Python")
+        self.assertEqual(friendly_type("Makefile", False), "Makefile")
+        self.assertEqual(friendly_type("README", False), "Readme")
+        self.assertEqual(friendly_type(".gitignore", False), "gitignore")
+        self.assertEqual(friendly_type("readme.weird", False), "Text")
+        self.assertEqual(friendly_type("blob.dat", True), "Binary")
+
 
 if __name__ == "__main__":
     unittest.main()
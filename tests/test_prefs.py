@@ -0,0 +1,80 @@
+import unittest
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+from unittest import mock
+
+from src.utils import prefs
+
+
+class TestPrefs(unittest.TestCase):
+    def setUp(self):
+        self.base = Path("tests/_tmp_prefs")
+        if self.base.exists():
+            shutil.rmtree(self.base)
+        self.base.mkdir(parents=True)
+        self.path = self.base / "prefs.json"
+        self._patch = mock.patch.object(prefs, "_prefs_path", return_value=self.path)
+        self._patch.start()
+        prefs._CACHE = None
+        prefs._CACHE_MTIME = None
+        prefs._DIRTY = False
+        prefs._LAST_SAVED = None
+
+    def tearDown(self):
+        self._patch.stop()
+        prefs._CACHE = None
+        prefs._DIRTY = False
+        if self.base.exists():
+            shutil.rmtree(self.base)
+
+    def _write_external(self, data: dict):
+        self.path.write_text(json.dumps(data), encoding="utf-8")
+        # Ensure a visible mtime change even on coarse-grained filesystems
+        ns = time.time_ns() + 10_000_000
+        os.utime(self.path, ns=(ns, ns))
+
+    def test_results_are_deep_copies(self):
+        prefs.save_prefs({"recent": [1, 2], "profiles": {"a": {"x": 1}}})
+        loaded = prefs.load_prefs()
+        loaded["recent"].append(3)
+        loaded["profiles"]["a"]["x"] = 99
+        self.assertEqual(prefs.load_prefs(), {"recent": [1, 2], "profiles": {"a": {"x": 1}}})
+
+        data = {"recent": [1]}
+        prefs.save_prefs(data)
+        data["recent"].append(2)
+        self.assertEqual(prefs.load_prefs()["recent"], [1])
+
+    def test_cached_until_mtime_changes(self):
+        self._write_external({"theme": "Dark"})
+        with mock.patch.object(prefs, "_read_from_disk", wraps=prefs._read_from_disk) as rd:
+            self.assertEqual(prefs.load_prefs(), {"theme": "Dark"})
+            self.assertEqual(prefs.load_prefs(), {"theme": "Dark"})
+            self.assertEqual(rd.call_count, 1)
+            self._write_external({"theme": "Light"})
+            self.assertEqual(prefs.load_prefs(), {"theme": "Light"})
+            self.assertEqual(rd.call_count, 2)
+
+    def test_unchanged_flush_is_skipped(self):
+        prefs.update_pref("theme", "Dark")           # no Qt app: writes through
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), {"theme": "Dark"})
+        with mock.patch.object(prefs.os, "replace", wraps=os.replace) as rep:
+            prefs.save_prefs(prefs.load_prefs())
+            rep.assert_not_called()
+            prefs.update_pref("theme", "Light")
+            rep.assert_called_once()
+
+    def test_atomic_replace(self):
+        prefs.update_pref("theme", "Dark")
+        self.assertEqual(sorted(os.listdir(self.base)), ["prefs.json"])
+        # A failed rename leaves the previous file intact
+        with mock.patch.object(prefs.os, "replace", side_effect=OSError("disk full")):
+            prefs.update_pref("theme", "Light")
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), {"theme": "Dark"})
+
+
+if __name__ == "__main__":
+    unittest.main()
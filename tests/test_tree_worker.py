@@ -0,0 +1,89 @@
+import unittest
+import os
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.ui_qt.workers.tree_worker import TreeWorker
+
+
+class TestTreeWorkerWalk(unittest.TestCase):
+    def setUp(self):
+        self.base = Path("tests/_tmp_tree_worker")
+        if self.base.exists():
+            shutil.rmtree(self.base)
+        files = [
+            "a.txt", "B.txt", "c.txt",
+            "Exact.TXT", "other.txt",
+            "xyz.py", "xz.py",
+            "debug.log", "tmp_cache.dat",
+            "sub/keep.md", "sub/drop.md",
+            "artifacts/out.bin",
+            "nested/artifacts/deep.bin",
+            "vendor/lib.py",
+            "node_modules/pkg.js",
+        ]
+        for rel in files:
+            p = self.base / rel
+            p.parent.mkdir(parents=True, exist_ok=True)
+            p.write_text("x", encoding="utf-8")
+        (self.base / "exact.txt").write_text("x", encoding="utf-8")
+        (self.base / ".gitignore").write_text("artifacts/\n", encoding="utf-8")
+
+    def tearDown(self):
+        if self.base.exists():
+            shutil.rmtree(self.base)
+
+    def _walk(self, **overrides):
+        state = SimpleNamespace(
+            selected_folder=str(self.base),
+            apply_gitignore=True,
+            use_default_folder_names=True,
+            excluded_folders=set(),
+            excluded_files_abs=set(),
+            excluded_file_patterns={"Exact.TXT", "x?z.py", "*.log", "tmp_*", os.path.join("sub", "drop.md")},
+        )
+        for k, v in overrides.items():
+            setattr(state, k, v)
+        worker = TreeWorker(state, "", "ascii", markdown=False, sizes=False)
+        return {rel: [e.name for e in files] for _curr, rel, files in worker._filtered_walk(str(self.base))}
+
+    def test_file_patterns(self):
+        top = self._walk()[""]
+        # Literal names match case-insensitively
+        self.assertNotIn("Exact.TXT", top)
+        self.assertNotIn("exact.txt", top)
+        # Globs use fnmatch semantics
+        self.assertNotIn("xyz.py", top)
+        self.assertIn("xz.py", top)
+        self.assertNotIn("debug.log", top)
+        self.assertNotIn("tmp_cache.dat", top)
+        self.assertIn("other.txt", top)
+
+    def test_relative_literal_pattern(self):
+        self.assertEqual(self._walk()["sub"], ["keep.md"])
+
+    def test_files_sorted_case_insensitively(self):
+        top = self._walk()[""]
+        txt = [n for n in top if n.endswith(".txt")]
+        self.assertEqual(txt, ["a.txt", "B.txt", "c.txt", "other.txt"])
+
+    def test_gitignore_directory_rules_prune(self):
+        dirs = self._walk()
+        self.assertNotIn("artifacts", dirs)
+        self.assertNotIn(os.path.join("nested", "artifacts"), dirs)
+        self.assertIn("nested", dirs)
+        self.assertIn("artifacts", self._walk(apply_gitignore=False))
+
+    def test_excluded_folders_are_normalized(self):
+        self.assertIn("vendor", self._walk())
+        self.assertNotIn("vendor", self._walk(excluded_folders={"vendor/"}))
+        self.assertNotIn("vendor", self._walk(excluded_folders={"./vendor"}))
+
+    def test_default_folder_names(self):
+        self.assertNotIn("node_modules", self._walk())
+        self.assertIn("node_modules", self._walk(use_default_folder_names=False))
+
+
+if __name__ == "__main__":
+    unittest.main()